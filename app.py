@@ -17,8 +17,16 @@ import plotly.graph_objects as go
 import streamlit as st
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
+from utils.article_store import ArticleStore
 from utils.news_fetcher import NewsFetcher
 from models.screener import AdverseMediaScreener
+from models.assessment_cache import AssessmentCache
+from models.triage import RiskTriage
+from models.dedupe import NearDuplicateClusterer
+from models.rate_limiter import AdaptiveRateLimiter
+from models.compact_results import compact_result, json_default
+from models.telemetry import JsonlSink
+from models.evidence import EvidenceSelector
 
 import os
 from dotenv import load_dotenv
@@ -650,9 +658,42 @@ elif "queued_quickstart" not in st.session_state:
     st.session_state["queued_quickstart"] = False
 
 
+QUICKSTART_ENTITIES = ["Tesla", "JP Morgan", "Wells Fargo", "Binance", "Bank of America"]
+
+
+@st.cache_resource(show_spinner=False)
+def _assessment_cache():
+    return AssessmentCache(os.getenv("ASSESSMENT_CACHE_PATH", "data/assessments.db"))
+
+
+@st.cache_resource(show_spinner=False)
+def _rate_limiter():
+    # One limiter per process so concurrent sessions share the provider's budget
+    return AdaptiveRateLimiter(
+        requests_per_minute=int(os.getenv("OPENROUTER_RPM", "60")),
+        tokens_per_minute=int(os.getenv("OPENROUTER_TPM", "200000"))
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _telemetry_sink():
+    # Per-call LLM telemetry as JSON lines; off unless LLM_TELEMETRY_PATH is set
+    path = os.getenv("LLM_TELEMETRY_PATH")
+    return JsonlSink(path) if path else None
+
+
+@st.cache_resource(show_spinner=False)
+def _article_store():
+    store = ArticleStore(os.getenv("ARTICLE_STORE_PATH", "data/articles.db"))
+    # First start on an existing install: bring over the per-key JSON cache files once
+    if store.stats()["articles"] == 0:
+        store.import_json_cache("data/cache", QUICKSTART_ENTITIES)
+    return store
+
+
 @st.cache_data(show_spinner=False, ttl=3600)
 def _cached_articles(entity_name: str, days_back: int, max_articles: int):
-    fetcher = NewsFetcher()
+    fetcher = NewsFetcher(store=_article_store())
     return fetcher.fetch_all_news(entity_name, days_back, max_articles)
 
 
@@ -739,6 +780,11 @@ if not st.session_state.screening_result:
                 index=0,
                 key="model_choice"
             )
+        cascade_enabled = st.checkbox(
+            "Cost-aware cascade: score every article with GPT-3.5 first, escalate only risky or low-confidence articles to the selected model",
+            value=False,
+            key="cascade_enabled"
+        )
     
     st.markdown('</div>', unsafe_allow_html=True)
     
@@ -747,7 +793,7 @@ if not st.session_state.screening_result:
     st.markdown('<p style="text-align:center; color:var(--slate-500); font-size:0.875rem; margin-bottom:1rem;">Quick Start</p>', unsafe_allow_html=True)
     
     example_cols = st.columns(5)
-    examples = ["Tesla", "JP Morgan", "Wells Fargo", "Binance", "Bank of America"]
+    examples = QUICKSTART_ENTITIES
     for col, example in zip(example_cols, examples):
         with col:
             if st.button(example, key=f"example_{example}", use_container_width=True):
@@ -777,13 +823,35 @@ if not st.session_state.screening_result:
                 st.stop()
             
             status.info(f"🤖 Analyzing {len(articles)} articles")
-            progress.progress(50)
-            time.sleep(0.25)
+            progress.progress(30)
             
-            screener = AdverseMediaScreener(model=model_choice)
-            result = screener.screen_entity(articles, entity_name)
+            screener = AdverseMediaScreener(
+                model=model_choice,
+                cache=_assessment_cache(),
+                # Off until enabled; check recall first with benchmarks/triage_recall.py
+                triage=RiskTriage(threshold=float(os.environ["TRIAGE_THRESHOLD"])) if os.getenv("TRIAGE_THRESHOLD") else None,
+                deduper=NearDuplicateClusterer(),
+                rate_limiter=_rate_limiter(),
+                telemetry_sink=_telemetry_sink(),
+                evidence_selector=EvidenceSelector(token_budget=int(os.getenv("EVIDENCE_TOKEN_BUDGET", "600"))),
+                fast_model="openai/gpt-3.5-turbo" if cascade_enabled else None
+            )
+            alerts = st.empty()
+            result = None
+            for event in screener.iter_screen_entity(articles, entity_name):
+                if event["event"] == "complete":
+                    result = event["result"]
+                    break
+                progress.progress(30 + int(65 * event["completed"] / event["total"]))
+                partial = event["partial"]
+                status.info(f"🤖 Analyzed {event['completed']}/{event['total']} articles • running severity {partial['overall_severity']}/100")
+                high_risk = partial["high_risk_articles"]
+                if high_risk:
+                    alerts.warning(f"⚠️ {len(high_risk)} high-risk alert(s) so far • top: {high_risk[0].get('article_title', '')[:90]}")
+            alerts.empty()
             
-            st.session_state.screening_result = result
+            # Session state lives as long as the browser tab; keep results in the packed form
+            st.session_state.screening_result = compact_result(result)
             st.session_state.screening_history.append({
                 "entity": entity_name,
                 "timestamp": datetime.now().isoformat(),
@@ -819,7 +887,17 @@ if st.session_state.screening_result:
             st.session_state.screening_result = None
             st.rerun()
     st.markdown('</div>', unsafe_allow_html=True)
-    
+
+    # Articles whose model call failed are listed but left out of the scores
+    failures = result.get("failures", {})
+    failed_count = failures.get("rate_limited", 0) + failures.get("errors", 0)
+    if failed_count:
+        st.warning(
+            f"{failed_count} of {result.get('articles_analyzed', 0)} articles could not be screened "
+            f"({failures.get('rate_limited', 0)} rate limited, {failures.get('errors', 0)} errors) "
+            "and are excluded from the risk scores."
+        )
+
     # Severity Logic
     severity = result.get("overall_severity", 0)
     if severity > 75:
@@ -848,6 +926,7 @@ if st.session_state.screening_result:
         <div class="metric-card">
           <div class="metric-label">Articles Screened</div>
           <div class="metric-value">{articles_count}</div>
+          <p style="color:var(--slate-500); font-size:0.8125rem; margin:0;">{result.get("triage", {}).get("triaged_out", 0)} triaged as routine</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -1083,7 +1162,7 @@ if st.session_state.screening_result:
     with tab5:
         col1, col2, col3 = st.columns([1, 1, 2])
         with col1:
-            json_data = json.dumps(result, indent=2)
+            json_data = json.dumps(result, indent=2, default=json_default)
             st.download_button(
                 "📥 Download JSON",
                 data=json_data,
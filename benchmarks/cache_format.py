@@ -0,0 +1,130 @@
+"""
+Cache file format benchmark on the recorded Google News corpus (data/cache/*.json)
+- Re-encodes every recorded result set in each format: the legacy json.dump(indent=2) text,
+  compact orjson (bare and with the cache header), and compact orjson in gzip / zstd framing
+  (zstd only when installed)
+- Measures on-disk bytes, encode time and load time (file read + decode, best of --repeat)
+- Writes a JSON report with totals per format and the ratio against the legacy format
+
+    python benchmarks/cache_format.py --repeat 20 --output cache_format.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+import orjson
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "src"))
+from utils import cache_codec
+from utils.file_cache import CACHE_EXT
+
+
+def _legacy_dumps(data) -> bytes:
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _legacy_loads(raw: bytes):
+    return json.loads(raw.decode("utf-8"))
+
+
+# name -> (encode, decode)
+FORMATS: Dict[str, tuple] = {
+    "legacy_json_indent2": (_legacy_dumps, _legacy_loads),
+    "orjson_compact": (orjson.dumps, orjson.loads),
+    # What NewsFetcher writes when zstandard is not installed
+    "orjson_framed": (lambda data: cache_codec.dumps(data, "none"), cache_codec.loads),
+    "orjson_gzip": (lambda data: cache_codec.dumps(data, "gzip"), cache_codec.loads),
+}
+if cache_codec.zstandard is not None:
+    FORMATS["orjson_zstd"] = (lambda data: cache_codec.dumps(data, "zstd"), cache_codec.loads)
+
+
+def load_corpus(cache_dir: str, limit: int = None) -> List:
+    corpus = []
+    for name in sorted(os.listdir(cache_dir)):
+        if name.endswith((".json", CACHE_EXT)):
+            corpus.append(cache_codec.read_file(os.path.join(cache_dir, name)))
+        if limit and len(corpus) >= limit:
+            break
+    return corpus
+
+
+def _best_of(repeat: int, fn: Callable) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_format(name: str, corpus: List, work_dir: str, repeat: int) -> Dict:
+    encode, decode = FORMATS[name]
+    paths, encode_seconds, load_seconds, total_bytes = [], 0.0, 0.0, 0
+    for i, data in enumerate(corpus):
+        encode_seconds += _best_of(repeat, lambda: encode(data))
+        path = os.path.join(work_dir, f"{name}_{i}")
+        with open(path, "wb") as f:
+            f.write(encode(data))
+        paths.append(path)
+        total_bytes += os.path.getsize(path)
+
+    def load(path):
+        with open(path, "rb") as f:
+            return decode(f.read())
+
+    for path, data in zip(paths, corpus):
+        assert load(path) == data, f"{name} does not round-trip"
+        load_seconds += _best_of(repeat, lambda: load(path))
+    return {
+        "format": name,
+        "bytes": total_bytes,
+        "encode_ms": round(encode_seconds * 1000, 2),
+        "load_ms": round(load_seconds * 1000, 2),
+        "load_ms_per_file": round(load_seconds * 1000 / max(len(corpus), 1), 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cache file formats on data/cache")
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, "data", "cache"))
+    parser.add_argument("--limit", type=int, default=None, help="use only the first N recorded result sets")
+    parser.add_argument("--repeat", type=int, default=10, help="timings are the best of this many runs")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.cache_dir, args.limit)
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "corpus": {"files": len(corpus), "articles": sum(len(data) for data in corpus)},
+        "repeat": args.repeat,
+        "formats": []
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name in FORMATS:
+            report["formats"].append(run_format(name, corpus, work_dir, args.repeat))
+    legacy = report["formats"][0]
+    for outcome in report["formats"]:
+        outcome["size_ratio"] = round(outcome["bytes"] / legacy["bytes"], 3)
+        outcome["load_speedup"] = round(legacy["load_ms"] / outcome["load_ms"], 2) if outcome["load_ms"] else None
+        print(f"{outcome['format']}: {outcome['bytes'] / 1024:.0f} KiB ({outcome['size_ratio']}x), "
+              f"load {outcome['load_ms']} ms ({outcome['load_speedup']}x faster)", file=sys.stderr)
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        print(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Parity check and timing for the vectorized portfolio aggregator (src/models/portfolio.py)
+- Generates random entities with random article assessments: routine, spiky, zero scores,
+  triaged-out (routine) assessments, failed-call fallbacks and entities with no articles
+- Compares aggregate_portfolio / portfolio_summaries with AdverseMediaScreener._aggregate_assessments
+  per entity (risk_scores, overall_severity, primary_risk, high-risk count)
+- Packs each entity into a CompactAssessments (as the app stores results), then times the
+  per-entity loop against the vectorized path, split into stacking the packed score matrices,
+  aggregate_portfolio itself and the conversion back to per-entity dicts
+- Exits non-zero on any mismatch, so a change to either side cannot drift silently
+
+    python benchmarks/portfolio_parity.py --entities 3000 --seed 0 --output portfolio_parity.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "src"))
+from models.compact_results import CompactAssessments
+from models.portfolio import aggregate_portfolio, portfolio_matrix, portfolio_summaries
+from models.screener import FALLBACK_PREFIX, AdverseMediaScreener
+from models.triage import RISK_CATEGORIES
+
+
+def random_assessment(rng: random.Random) -> Dict:
+    shape = rng.random()
+    if shape < 0.1:
+        scores = {c: 0 for c in RISK_CATEGORIES}
+    elif shape < 0.6:
+        scores = {c: rng.randint(8, 30) for c in RISK_CATEGORIES}
+    else:
+        scores = {c: rng.choice([0, rng.randint(1, 100)]) for c in RISK_CATEGORIES}
+    severity = max(scores.values())
+    tier = rng.random()
+    return {
+        **scores,
+        "overall_severity": severity,
+        "primary_risk": max(scores, key=scores.get),
+        # About one in 20 is a failed call, whose placeholder scores must not count
+        "explanation": f"{FALLBACK_PREFIX} Unable to screen article due to error." if tier < 0.05 else "",
+        "model_tier": "triage" if tier > 0.6 else "primary"
+    }
+
+
+def random_portfolio(rng: random.Random, entities: int, max_articles: int) -> List[List[Dict]]:
+    # About one entity in 50 has no articles
+    sizes = [0 if rng.random() < 0.02 else rng.randint(1, max_articles) for _ in range(entities)]
+    return [[random_assessment(rng) for _ in range(size)] for size in sizes]
+
+
+def compare(portfolio: List[List[Dict]], screener: AdverseMediaScreener) -> Dict:
+    names = [f"entity-{i}" for i in range(len(portfolio))]
+
+    started = time.perf_counter()
+    expected = [screener._aggregate_assessments(assessments, name) for assessments, name in zip(portfolio, names)]
+    loop_seconds = time.perf_counter() - started
+
+    # Results are kept packed (app.py stores compact_result(result)), so packing is not timed
+    started = time.perf_counter()
+    packed = [CompactAssessments(assessments) for assessments in portfolio]
+    pack_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scores, severity, segments, routine = portfolio_matrix(packed)
+    matrix_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    aggregated = aggregate_portfolio(scores, severity, segments, len(portfolio), routine=routine)
+    aggregate_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = portfolio_summaries(names, aggregated)
+    summaries_seconds = time.perf_counter() - started
+    vector_seconds = matrix_seconds + aggregate_seconds + summaries_seconds
+
+    mismatches = []
+    for name, assessments, want, got in zip(names, portfolio, expected, actual):
+        if not assessments:
+            # screen_entity returns _empty_result for these; only the zero scores are comparable
+            fields = ["risk_scores", "overall_severity"]
+        else:
+            fields = ["risk_scores", "overall_severity", "primary_risk"]
+        diff = {field: (want[field], got[field]) for field in fields if want[field] != got[field]}
+        if len(want["high_risk_articles"]) != got["high_risk_count"]:
+            diff["high_risk_count"] = (len(want["high_risk_articles"]), got["high_risk_count"])
+        if diff:
+            mismatches.append({"entity": name, "diff": diff})
+    return {
+        "entities": len(portfolio),
+        "articles": int(segments.size),
+        "mismatches": len(mismatches),
+        "examples": mismatches[:5],
+        "loop_ms": round(loop_seconds * 1000, 1),
+        "pack_ms": round(pack_seconds * 1000, 1),
+        "matrix_ms": round(matrix_seconds * 1000, 1),
+        "aggregate_ms": round(aggregate_seconds * 1000, 1),
+        "summaries_ms": round(summaries_seconds * 1000, 1),
+        # aggregate_portfolio alone vs the loop: the saving when callers already hold the arrays
+        "aggregate_speedup": round(loop_seconds / aggregate_seconds, 1) if aggregate_seconds else None,
+        # Including stacking the packed matrices and converting back to dicts
+        "end_to_end_speedup": round(loop_seconds / vector_seconds, 1) if vector_seconds else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check aggregate_portfolio against the per-entity aggregation")
+    parser.add_argument("--entities", type=int, default=3000)
+    parser.add_argument("--max-articles", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    # No model calls are made; the local base_url only avoids needing an API key
+    screener = AdverseMediaScreener(base_url="http://127.0.0.1:9/v1")
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "seed": args.seed,
+        **compare(random_portfolio(random.Random(args.seed), args.entities, args.max_articles), screener)
+    }
+    print(f"{report['entities']} entities / {report['articles']} articles: {report['mismatches']} mismatches; "
+          f"aggregate {report['aggregate_speedup']}x, end to end {report['end_to_end_speedup']}x faster", file=sys.stderr)
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        print(data)
+    if report["mismatches"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+"""
+End-to-end screening benchmark on the recorded Google News corpus (data/cache/*.json)
+- Each recorded result set is replayed through NewsFetcher (cache hit, normalization, URL dedupe)
+  and AdverseMediaScreener against the local mock model (src/api/mock_llm.py), which runs in
+  its own process so it does not compete with the screener for the GIL
+- Every configuration sees identical inputs, so runs are comparable
+- Writes a JSON report: articles/sec, p50/p95 per-article latency, tokens/article,
+  peak memory and per-stage hit ratios
+
+    python benchmarks/screening.py --config baseline --config batched --output report.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "src"))
+from models.assessment_cache import AssessmentCache
+from models.dedupe import NearDuplicateClusterer
+from models.rate_limiter import AdaptiveRateLimiter
+from models.screener import AdverseMediaScreener
+from models.triage import RiskTriage
+from utils import cache_codec
+from utils.article_store import infer_entity
+from utils.file_cache import FileCache
+from utils.news_fetcher import NewsFetcher
+
+DAYS_BACK = 30
+# name -> screener / screen_entity options; "passes" > 1 replays the corpus again (warm cache)
+CONFIGS = {
+    "baseline": {},
+    "batched": {"batched": True},
+    "triage": {"triage": True},
+    "dedupe": {"dedupe": True},
+    "cached": {"cache": True, "passes": 2},
+    "limited": {"rate_limiter": True},
+    "full": {"triage": True, "dedupe": True, "cache": True, "rate_limiter": True, "passes": 2},
+}
+
+
+class MockServerProcess:
+    """src/api/mock_llm.py in a child process on a free local port."""
+
+    def __init__(self, **options):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{self.port}/v1"
+        args = [sys.executable, "-m", "api.mock_llm", "--port", str(self.port)]
+        for name, value in options.items():
+            args += [f"--{name.replace('_', '-')}", str(value)]
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [os.path.join(ROOT, "src"), os.environ.get("PYTHONPATH")]))}
+        self._process = subprocess.Popen(args, env=env, stdout=subprocess.DEVNULL)
+
+    def __enter__(self):
+        deadline = time.monotonic() + 15
+        while True:
+            try:
+                self.stats()
+                return self
+            except OSError:
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    self._process.kill()
+                    raise RuntimeError("mock LLM server did not start")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc):
+        self._process.terminate()
+        self._process.wait()
+
+    def stats(self) -> Dict:
+        with urllib.request.urlopen(f"{self.url}/stats", timeout=5) as response:
+            return json.load(response)
+
+
+class RssSampler:
+    """Peak resident memory while the block runs (sampled /proc/self/statm; process peak elsewhere)."""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self) -> int:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            return _peak_rss_bytes()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak_bytes = max(self.peak_bytes, self._sample())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self.peak_bytes = self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_bytes = max(self.peak_bytes, self._sample())
+
+
+def load_corpus(cache_dir: str, limit: int = None) -> List[Dict]:
+    corpus = []
+    for name in sorted(os.listdir(cache_dir)):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(cache_dir, name)
+        with open(path, "r", encoding="utf-8") as f:
+            articles = json.load(f)
+        if articles:
+            corpus.append({"file": name, "path": path, "entity": infer_entity(articles), "articles": len(articles)})
+        if limit and len(corpus) >= limit:
+            break
+    return corpus
+
+
+def replay_fetch(corpus: List[Dict], work_dir: str) -> List[Dict]:
+    """Serve each recorded file as today's NewsFetcher cache entry and fetch it through the normal path."""
+    fetcher = NewsFetcher(cache=FileCache(os.path.join(work_dir, "news_cache"), janitor_interval=None))
+    fetched = []
+    for item in corpus:
+        fetcher.cache.put(fetcher._get_cache_key(item["entity"], DAYS_BACK), cache_codec.read_file(item["path"]))
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            articles = fetcher.fetch_all_news(item["entity"], days_back=DAYS_BACK, max_articles=item["articles"])
+        fetched.append({
+            **item,
+            "fetched": articles,
+            "fetch_seconds": time.perf_counter() - started,
+            "normalization": fetcher.last_normalization_stats
+        })
+    return fetched
+
+
+def _timed(latencies: List[float], fn, articles_of):
+    """Wrap a screener method so each call adds its wall time once per article it scored."""
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            latencies.extend([time.perf_counter() - started] * articles_of(*args))
+    return wrapper
+
+
+def run_config(name: str, options: Dict, fetched: List[Dict], server: MockServerProcess, work_dir: str, max_workers: int) -> Dict:
+    cache = AssessmentCache(os.path.join(work_dir, f"{name}.db")) if options.get("cache") else None
+    screener = AdverseMediaScreener(
+        model="mock/strong",
+        base_url=server.url,
+        max_workers=max_workers,
+        cache=cache,
+        triage=RiskTriage() if options.get("triage") else None,
+        deduper=NearDuplicateClusterer() if options.get("dedupe") else None,
+        rate_limiter=AdaptiveRateLimiter(requests_per_minute=100_000, tokens_per_minute=100_000_000,
+                                         max_concurrency=max_workers, base_delay=0.05, max_delay=1.0) if options.get("rate_limiter") else None
+    )
+    latencies = []
+    screener.screen_article = _timed(latencies, screener.screen_article, lambda *args: 1)
+    screener.screen_articles_batch = _timed(latencies, screener.screen_articles_batch, lambda texts, *args: len(texts))
+
+    passes = []
+    for number in range(options.get("passes", 1)):
+        server_before = server.stats()
+        latencies.clear()
+        stages = Counter()
+        articles = tokens = 0
+        with RssSampler() as rss:
+            started = time.perf_counter()
+            for item in fetched:
+                result = screener.screen_entity(item["fetched"], item["entity"], max_workers=max_workers, batched=options.get("batched", False))
+                articles += len(item["fetched"])
+                tokens += result["usage"]["prompt_tokens"] + result["usage"]["completion_tokens"]
+                stages["cache_hits"] += result.get("cache", {}).get("hits", 0)
+                stages["cache_misses"] += result.get("cache", {}).get("misses", 0)
+                stages["triaged_out"] += result.get("triage", {}).get("triaged_out", 0)
+                stages["triage_candidates"] += result.get("triage", {}).get("candidates", 0)
+                stages["duplicates"] += result.get("dedupe", {}).get("duplicates", 0)
+                stages["rate_limited_fallbacks"] += result["failures"]["rate_limited"]
+                stages["error_fallbacks"] += result["failures"]["errors"]
+            elapsed = time.perf_counter() - started
+        server_after = server.stats()
+        passes.append({
+            "pass": number + 1,
+            "entities": len(fetched),
+            "articles": articles,
+            "wall_seconds": round(elapsed, 3),
+            "articles_per_sec": round(articles / elapsed, 2) if elapsed else None,
+            "model_calls": server_after["requests"] - server_before["requests"],
+            "latency_ms": _latency_summary(latencies),
+            "tokens_per_article": round(tokens / articles, 1) if articles else 0.0,
+            "peak_rss_mb": round(rss.peak_bytes / 2 ** 20, 1),
+            "stages": _stage_summary(stages, articles)
+        })
+    if cache is not None:
+        cache.close()
+    return {
+        "name": name,
+        "options": options,
+        "passes": passes,
+        "limiter": screener.rate_limiter.stats() if screener.rate_limiter is not None else None
+    }
+
+
+def _latency_summary(latencies: List[float]) -> Dict:
+    if not latencies:
+        return {"count": 0, "p50": None, "p95": None, "mean": None}
+    values = np.asarray(latencies) * 1000
+    return {
+        "count": len(values),
+        "p50": round(float(np.percentile(values, 50)), 1),
+        "p95": round(float(np.percentile(values, 95)), 1),
+        "mean": round(float(values.mean()), 1)
+    }
+
+
+def _stage_summary(stages: Counter, articles: int) -> Dict:
+    lookups = stages["cache_hits"] + stages["cache_misses"]
+    triaged = stages["triaged_out"] + stages["triage_candidates"]
+    return {
+        "dedupe": {"duplicates": stages["duplicates"], "ratio": round(stages["duplicates"] / articles, 4) if articles else 0.0},
+        "cache": {"hits": stages["cache_hits"], "misses": stages["cache_misses"], "hit_ratio": round(stages["cache_hits"] / lookups, 4) if lookups else None},
+        "triage": {"triaged_out": stages["triaged_out"], "candidates": stages["triage_candidates"], "skip_ratio": round(stages["triaged_out"] / triaged, 4) if triaged else None},
+        "fallbacks": {"rate_limited": stages["rate_limited_fallbacks"], "errors": stages["error_fallbacks"]}
+    }
+
+
+def _peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay data/cache through the screening pipeline against a mock model")
+    parser.add_argument("--config", action="append", choices=sorted(CONFIGS), help="configuration to run (repeatable, default: all)")
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, "data", "cache"))
+    parser.add_argument("--limit", type=int, default=None, help="replay only the first N recorded result sets")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.cache_dir, args.limit)
+    server_options = {"latency": args.latency, "latency_ms": args.latency_ms, "rate_limit_rate": args.rate_limit_rate,
+                      "error_rate": args.error_rate, "seed": args.seed}
+    report = {
+        "generated_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "corpus": {"files": len(corpus), "articles": sum(item["articles"] for item in corpus)},
+        "mock_server": server_options,
+        "workers": args.workers,
+        "configs": []
+    }
+    with tempfile.TemporaryDirectory() as work_dir:
+        fetched = replay_fetch(corpus, work_dir)
+        report["fetch"] = {
+            "entities": [{"file": item["file"], "entity": item["entity"], "articles": len(item["fetched"])} for item in fetched],
+            "articles": sum(len(item["fetched"]) for item in fetched),
+            "seconds": round(sum(item["fetch_seconds"] for item in fetched), 3),
+            "tokens_saved_est": sum(item["normalization"]["tokens_saved_est"] for item in fetched)
+        }
+        for name in args.config or list(CONFIGS):
+            # A fresh server per configuration so injected failures and prefix caching start from the same state
+            with MockServerProcess(**server_options) as server:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    outcome = run_config(name, CONFIGS[name], fetched, server, work_dir, args.workers)
+                outcome["server"] = server.stats()
+            report["configs"].append(outcome)
+            print(f"{name}: {outcome['passes'][-1]['articles_per_sec']} articles/sec", file=sys.stderr)
+    report["peak_rss_mb"] = round(_peak_rss_bytes() / 2 ** 20, 1)
+
+    data = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        print(data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Recall check for the pre-LLM triage lexicon (src/models/triage.py)
+- A labelled subset of the recorded corpus (data/cache): every adverse item the triage
+  drops is scored as routine without a model call, so recall on CORPUS_ADVERSE must stay at target
+- Also reports recall on a hand-written headline sample, and the routine skip rate on both
+  and on the whole corpus, i.e. how many model calls triage saves
+- Exits non-zero when recall on the labelled corpus or on the headline sample is below
+  --min-recall; run it before enabling TRIAGE_THRESHOLD
+
+    python benchmarks/triage_recall.py --threshold 0.5
+"""
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(ROOT, "src"))
+from models.triage import RiskTriage
+from utils import cache_codec
+from utils.text_normalizer import normalize_article
+
+ADVERSE = [
+    "SEC charges Tesla CEO with securities law breaches",
+    "Binance to pay $4.3 billion in DOJ settlement",
+    "FTX collapses amid missing customer funds",
+    "JPMorgan agrees to pay $200 million to settle SEC recordkeeping case",
+    "CEO ousted after misconduct",
+    "Wells Fargo fired employees over fake accounts",
+    "Bank fined $1.3 billion for anti-money laundering failures",
+    "Former executive indicted on wire fraud counts",
+    "Regulators open probe into crypto exchange's handling of client assets",
+    "Company files for Chapter 11 bankruptcy protection",
+    "Retailer confirms data breach exposing millions of card numbers",
+    "Hackers hit hospital chain with ransomware attack",
+    "Mining firm accused of forced labor in supply chain",
+    "Treasury sanctions shipping company over Iran oil trade",
+    "Exchange added to OFAC blacklist",
+    "Bank admits to helping clients launder drug money",
+    "Contractor paid bribes to win government deals, prosecutors say",
+    "Pharma giant settles FCPA case for $100 million",
+    "Automaker recalls 2 million vehicles over safety defect",
+    "Oil spill off the coast blamed on pipeline operator",
+    "FTC sues retailer over deceptive subscription practices",
+    "CFTC fines trading firm for spoofing",
+    "Founder sentenced to 25 years in prison",
+    "Lender halts withdrawals as liquidity dries up",
+    "Auditor raises going concern doubt about startup",
+    "Insurer accused of misleading investors about losses",
+    "Whistleblower alleges accounting irregularities at chipmaker",
+    "Attorney general sues bank over hidden fees",
+    "Broker-dealer agrees to FINRA penalty",
+    "Fund manager charged with insider trading",
+    "Exchange faces class action over outage losses",
+    "Ponzi scheme operator pleads guilty",
+    "Bank's CEO resigns amid scandal",
+    "Court approves liquidation of collapsed lender",
+    "Watchdog orders bank to pay restitution to customers",
+    "Company restates earnings after accounting errors",
+    "Airline fined over discrimination against disabled passengers",
+    "Executives arrested in embezzlement case",
+    "Crypto firm misused customer funds, filing shows",
+    "Regulator issues cease and desist order against payments app",
+    "Bank fined over failures",
+    "Startup faked revenue figures to lure investors",
+    "Lender sued by state over hidden fees",
+]
+
+ROUTINE = [
+    "Tesla opens new charging stations in second quarter",
+    "Bank reports its finest quarter in a decade",
+    "Company announces new product line for fall",
+    "Retailer opens flagship store in downtown Chicago",
+    "CEO speaks at industry conference on digital transformation",
+    "Automaker unveils redesigned electric SUV",
+    "Bank raises dividend after strong earnings",
+    "Tech firm hires new chief marketing officer",
+    "Airline adds nonstop routes to Europe",
+    "Chipmaker beats revenue estimates on AI demand",
+    "Company named one of best places to work",
+    "Streaming service adds live sports package",
+    "Startup raises $50 million in Series B round",
+    "Bank launches mobile app redesign",
+    "Shares rise after upbeat guidance",
+    "Firm opens regional office and plans to hire 200 employees",
+    "Analysts expect steady growth next year",
+    "Company partners with university on research program",
+    "Exchange lists new exchange-traded fund",
+    "Retailer expands same-day delivery to new cities",
+]
+
+# Labelled headlines from the recorded corpus; texts are looked up by title so the
+# check runs over the same title + body the screener sees
+CORPUS_ADVERSE = [
+    "BaFin imposes €45M fine on J.P. Morgan SE",
+    "Germany’s BaFin levies $52m fine on JP Morgan",
+    "JP Morgan handed record €45 million fine over AML failures",
+    "NOTEBOOK: How €45 million JP Morgan fine shows Germany is worryingly still at an AML crossroads",
+    "Germany fines JPMorgan €45 million for anti-money-laundering failings",
+    "JP Morgan warned US of $1bn in Epstein transactions possibly related to human trafficking",
+    "Startup Founder Defrauded J.P. Morgan Of $175M — They’re Still Stuck Paying Her Legal Bills And Hotel Upgrades",
+    "Key executive convicted of defrauding JPMorgan Chase is sentenced to over 5 years in prison",
+    "JPMorgan discloses US probe over alleged conservative ‘debanking’ scandal",
+    "2 killed, 2 hurt after speeding Tesla hits tree, catches fire and ignites Petersburg home, police say",
+    "Off-duty LAPD officer killed in solo-vehicle Tesla crash in Santa Clarita, authorities say",
+    "Wisconsin family sues Tesla over crash that killed 5",
+    "US family sues Tesla, alleging wrongful death due to faulty doors",
+    "Tesla accused of not following key law",
+    "Tesla issues recall on more than 60,000 Cybertrucks after discovering serious safety hazard: 'Increase the risk of a collision'",
+    "Perplexity accuses Amazon of ‘bullying’ after e-commerce giant sends cease-and-desist letter",
+    "Why is New Jersey suing Amazon? Here's what's behind AG Platkin's complaint",
+    "Did Amazon trick people into paying for Prime? Federal case goes to trial",
+    "A jury will look at whether Amazon tricked customers into joining Prime -- and made it hard to leave",
+    "Amazon and Perplexity Face Off in Legal Battle Over Agentic Commerce",
+    "Amazon to pay $2.5 billion to settle U.S. lawsuit that it 'tricked' people into Prime",
+    "Checking In on Litigation at Binance, Coinbase, and More",
+    "Trump pardons convicted Binance founder Changpeng Zhao",
+    "Bank of America responds to federal scrutiny following Trump’s debanking order",
+    "Texas Is Third State To Sue Roblox As Controversy Over Child Safety Grows",
+    "California man accused of solicitation of Florida child through Roblox, authorities say",
+    "Texas sues Roblox over child safety claims",
+    "Feds To Open Probe Over Wells Fargo Sales Shenanigans",
+    "Well Fargo Ignored Sexual Harassment Claims, Worker Says",
+    "Wells Fargo’s Latest Discrimination Case Parallels Past Claims",
+]
+
+CORPUS_ROUTINE = [
+    "J.P. Morgan raises IREN price target to $28 following Microsoft cloud deal",
+    "JPMorgan sees bitcoin price reaching about $170,000 within the next 6 to 12 months",
+    "HB Wealth Opens Charlotte Office With $15-Bln J.P. Morgan Private Bank Team",
+    "J.P. Morgan Payments and Oracle Expand Partnership",
+    "JP Morgan Maintains Trex (TREX) Neutral Recommendation",
+    "Tesla begins hiring for workers at its new $200M Houston-area manufacturing plant",
+    "Tesla confirms Robotaxi is heading to five new cities in the U.S.",
+    "Tesla shareholders approve Elon Musk's trillion-dollar pay package",
+    "Tesla Adds Charge Port Heater Option in Update 2024.44",
+    "Binance Will Add Sapien (SAPIEN) on Earn, Buy Crypto, Convert & Margin",
+    "Binance Futures Launches the Futures DCA Bot",
+    "Bank of America Reports Third Quarter 2025 Financial Results",
+    "Bank of America Names New Leaders for UK Investment Banking",
+    "Bank of America pledges $250M to combat food insecurity",
+    "Viking releases new data on VK2735 in prediabetes, metabolic syndrome",
+    "Wells Fargo at The BancAnalysts Conference: Strategic Growth and Efficiency",
+    "DoorDash to deliver 1 million meals, support food banks during government shutdown",
+    "Roblox CEO says child safety is industry-wide issue, plans tools to keep bad actors off platform",
+    "JPMorgan’s Billionaire Clients Want Sports Teams More Than Fine Art",
+    "The Cadillac Formula 1 Team’s Drivers Aren’t American And That’s Fine … For Now",
+]
+
+
+def _article_text(article: Dict) -> str:
+    return "\n\n".join(part for part in (article.get("title", ""), article.get("content", "")) if part)
+
+
+def load_corpus(cache_dir: str) -> List[Dict]:
+    articles = []
+    for name in sorted(os.listdir(cache_dir)):
+        if name.endswith((".json", ".cache")):
+            articles.extend(normalize_article(article) for article in cache_codec.read_file(os.path.join(cache_dir, name)))
+    return articles
+
+
+def labelled_corpus(articles: List[Dict]) -> Tuple[List[str], List[str], List[str]]:
+    """Texts of the labelled corpus items as (adverse, routine, titles not found in the corpus)."""
+    by_title = {}
+    for article in articles:
+        by_title.setdefault(article.get("title", ""), _article_text(article))
+    missing = [title for title in CORPUS_ADVERSE + CORPUS_ROUTINE if title not in by_title]
+    adverse = [by_title[title] for title in CORPUS_ADVERSE if title in by_title]
+    routine = [by_title[title] for title in CORPUS_ROUTINE if title in by_title]
+    return adverse, routine, missing
+
+
+def evaluate(triage: RiskTriage, adverse: List[str], routine: List[str]) -> Dict:
+    candidates, _ = triage.split(adverse + routine)
+    candidates = set(candidates)
+    missed = [text.split("\n\n")[0] for i, text in enumerate(adverse) if i not in candidates]
+    skipped = [text for i, text in enumerate(routine, start=len(adverse)) if i not in candidates]
+    return {
+        "adverse": len(adverse),
+        "recall": round(1 - len(missed) / max(len(adverse), 1), 3),
+        "missed": missed,
+        "routine": len(routine),
+        "routine_skip_rate": round(len(skipped) / max(len(routine), 1), 3)
+    }
+
+
+def corpus_skip_ratio(triage: RiskTriage, articles: List[Dict]) -> Dict:
+    texts = [_article_text(article) for article in articles]
+    _, routine = triage.split(texts)
+    return {"articles": len(texts), "skip_ratio": round(len(routine) / max(len(texts), 1), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check triage recall on labelled corpus items and headlines")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--min-recall", type=float, default=1.0)
+    parser.add_argument("--cache-dir", default=os.path.join(ROOT, "data", "cache"))
+    args = parser.parse_args()
+
+    triage = RiskTriage(threshold=args.threshold)
+    report = {"threshold": args.threshold, "sample": evaluate(triage, ADVERSE, ROUTINE)}
+    gated = ["sample"]
+    if os.path.isdir(args.cache_dir):
+        articles = load_corpus(args.cache_dir)
+        adverse, routine, missing = labelled_corpus(articles)
+        report["labelled_corpus"] = {**evaluate(triage, adverse, routine), "not_in_corpus": missing}
+        gated.append("labelled_corpus")
+        report["corpus"] = corpus_skip_ratio(triage, articles)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    failed = [name for name in gated if report[name]["recall"] < args.min_recall]
+    for name in failed:
+        print(f"{name} recall {report[name]['recall']} below {args.min_recall}", file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
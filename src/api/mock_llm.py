@@ -0,0 +1,318 @@
+"""
+Local stand-in for the OpenRouter chat-completions API
+- Answers POST /v1/chat/completions with schema-valid RiskAssessment / BatchRiskAssessment
+  tool calls (instructor's default TOOLS mode) or JSON content when no tools are sent
+- Deterministic scores per (entity, article): lexicon hits raise the matching categories
+- Configurable latency distribution, 429 / 5xx injection, server-side concurrency cap
+- usage with prompt/completion tokens and simulated prefix caching (cached_tokens)
+- GET /v1/stats returns the request / failure / token counters
+
+Run with src on the path, e.g.:
+    PYTHONPATH=src python -m api.mock_llm --port 8088 --latency-ms 600 --rate-limit-rate 0.05
+then point the screener at it with base_url="http://127.0.0.1:8088/v1" (or LLM_BASE_URL).
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+
+from models.prompts import CHARS_PER_TOKEN
+from models.triage import RISK_CATEGORIES, RiskTriage
+
+# OpenAI caches prompt prefixes of at least 1024 tokens, in 128-token steps
+CACHE_MIN_TOKENS = 1024
+CACHE_STEP_TOKENS = 128
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+_ENTITY_RE = re.compile(r"ENTITY:\s*(.*)")
+_BATCH_ITEM_RE = re.compile(r"^\[(\d+)\]\n", re.MULTILINE)
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // CHARS_PER_TOKEN)
+
+
+def _message_text(message: Dict) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") for part in content)
+
+
+class MockLLMServer:
+    """
+    Threaded HTTP server speaking enough of the chat-completions API for AdverseMediaScreener.
+    latency: distribution of the per-request delay around latency_ms (spread is the uniform
+    half-width / lognormal sigma); ms_per_output_token adds generation time.
+    rate_limit_rate / error_rate: probability of a 429 (with Retry-After) / a 503 per request.
+    max_concurrency: requests beyond this many in flight get a 429, like a provider concurrency cap.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: str = "lognormal",
+                 latency_ms: float = 500.0, latency_spread: float = 0.4, ms_per_output_token: float = 0.0,
+                 rate_limit_rate: float = 0.0, error_rate: float = 0.0, retry_after: float = 1.0,
+                 max_concurrency: int = None, seed: int = 0):
+        if latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"latency must be one of {LATENCY_DISTRIBUTIONS}")
+        self.latency = latency
+        self.latency_ms = latency_ms
+        self.latency_spread = latency_spread
+        self.ms_per_output_token = ms_per_output_token
+        self.rate_limit_rate = rate_limit_rate
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.max_concurrency = max_concurrency
+        self.triage = RiskTriage()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._seen_prefixes = set()
+        self._in_flight = 0
+        self._counters = {"requests": 0, "completed": 0, "rate_limited": 0, "errors": 0, "peak_in_flight": 0,
+                          "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._counters, in_flight=self._in_flight)
+
+    # Request handling
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/stats"):
+                    self._send(200, server.stats())
+                else:
+                    self._send(404, {"error": {"message": f"unknown path {self.path}", "type": "invalid_request_error"}})
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send(404, {"error": {"message": f"unknown path {self.path}", "type": "invalid_request_error"}})
+                    return
+                length = int(self.headers.get("content-length", 0))
+                try:
+                    body = json.loads(self.rfile.read(length) or b"{}")
+                except json.JSONDecodeError:
+                    self._send(400, {"error": {"message": "invalid JSON body", "type": "invalid_request_error"}})
+                    return
+                status, payload, headers = server._complete(body)
+                self._send(status, payload, headers)
+
+            def _send(self, status: int, payload: Dict, headers: Dict = None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _complete(self, body: Dict):
+        with self._lock:
+            self._counters["requests"] += 1
+            over_capacity = self.max_concurrency is not None and self._in_flight >= self.max_concurrency
+            roll = self._random.random()
+            if over_capacity or roll < self.rate_limit_rate:
+                self._counters["rate_limited"] += 1
+                return 429, {"error": {"message": "Rate limit exceeded (mock)", "type": "rate_limit_exceeded", "code": 429}}, \
+                    {"retry-after": str(self.retry_after)}
+            self._in_flight += 1
+            self._counters["peak_in_flight"] = max(self._counters["peak_in_flight"], self._in_flight)
+            delay = self._sample_latency()
+            fail = roll < self.rate_limit_rate + self.error_rate
+        try:
+            if fail:
+                time.sleep(delay)
+                with self._lock:
+                    self._counters["errors"] += 1
+                return 503, {"error": {"message": "Upstream unavailable (mock)", "type": "server_error", "code": 503}}, None
+            payload = self._completion(body)
+            time.sleep(delay + self.ms_per_output_token * payload["usage"]["completion_tokens"] / 1000)
+            with self._lock:
+                self._counters["completed"] += 1
+            return 200, payload, None
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _sample_latency(self) -> float:
+        """Seconds to wait before answering; caller holds the lock."""
+        mean = self.latency_ms / 1000
+        if self.latency == "fixed":
+            return mean
+        if self.latency == "uniform":
+            return max(0.0, self._random.uniform(mean * (1 - self.latency_spread), mean * (1 + self.latency_spread)))
+        if self.latency == "exponential":
+            return self._random.expovariate(1 / mean) if mean > 0 else 0.0
+        # lognormal with latency_ms as the median: a long tail like real providers
+        return mean * self._random.lognormvariate(0, self.latency_spread)
+
+    def _completion(self, body: Dict) -> Dict:
+        messages = body.get("messages", [])
+        user = next((_message_text(m) for m in reversed(messages) if m.get("role") == "user"), "")
+        system = "".join(_message_text(m) for m in messages if m.get("role") == "system")
+        entity_match = _ENTITY_RE.search(user)
+        entity = entity_match.group(1).strip() if entity_match else ""
+
+        tools = body.get("tools") or []
+        function = tools[0]["function"] if tools else {}
+        batched = "assessments" in function.get("parameters", {}).get("properties", {})
+        if batched:
+            arguments = {"assessments": [
+                {**self._assessment(entity, text), "article_index": index}
+                for index, text in self._batch_articles(user)
+            ]}
+        else:
+            arguments = self._assessment(entity, self._article(user))
+        content = json.dumps(arguments)
+
+        if tools:
+            message = {"role": "assistant", "content": None, "tool_calls": [{
+                "id": f"call_{hashlib.md5(content.encode()).hexdigest()[:24]}",
+                "type": "function",
+                "function": {"name": function.get("name", "RiskAssessment"), "arguments": content}
+            }]}
+        else:
+            message = {"role": "assistant", "content": content}
+        prompt_tokens = _tokens(system) + _tokens(user)
+        completion_tokens = _tokens(content)
+        cached_tokens = self._cached_tokens(system)
+        with self._lock:
+            self._counters["prompt_tokens"] += prompt_tokens
+            self._counters["cached_tokens"] += cached_tokens
+            self._counters["completion_tokens"] += completion_tokens
+        return {
+            "id": f"chatcmpl-mock-{self._counters['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "mock"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens}
+            }
+        }
+
+    def _cached_tokens(self, system: str) -> int:
+        """Simulated prefix cache: a repeated system prompt is served from cache after the first call."""
+        tokens = _tokens(system)
+        if tokens < CACHE_MIN_TOKENS:
+            return 0
+        key = hashlib.sha256(system.encode()).digest()
+        with self._lock:
+            hit = key in self._seen_prefixes
+            self._seen_prefixes.add(key)
+        return tokens // CACHE_STEP_TOKENS * CACHE_STEP_TOKENS if hit else 0
+
+    @staticmethod
+    def _article(user: str) -> str:
+        # v2 puts only the article after "ARTICLE:"; v1 follows it with the rubric
+        text = user.split("ARTICLE:", 1)[-1]
+        return text.split("SCORING GUIDELINES:", 1)[0].strip()
+
+    @staticmethod
+    def _batch_articles(user: str) -> List:
+        text = user.split("ARTICLES:", 1)[-1].split("SCORING GUIDELINES:", 1)[0]
+        parts = _BATCH_ITEM_RE.split(text)
+        # split() yields [prefix, index, body, index, body, ...]
+        return [(int(parts[i]), parts[i + 1].strip()) for i in range(1, len(parts) - 1, 2)]
+
+    def _assessment(self, entity: str, text: str) -> Dict:
+        """Deterministic, schema-valid RiskAssessment fields for one article."""
+        seed = int.from_bytes(hashlib.blake2b(f"{entity}\x00{text}".encode(), digest_size=8).digest(), "big")
+        rng = random.Random(seed)
+        signal = self.triage.signal_matrix([text])[0]
+        general = float(signal[self.triage.labels.index("general")]) if "general" in self.triage.labels else 0.0
+        scores = {}
+        for category in RISK_CATEGORIES:
+            hits = float(signal[self.triage.labels.index(category)])
+            scores[category] = min(100, rng.randint(11, 29) + int(22 * hits + 6 * general))
+        primary = max(scores, key=scores.get)
+        sentences = [s for s in _SENTENCE_RE.split(text) if s][:2]
+        return {
+            **scores,
+            "primary_risk": primary,
+            "overall_severity": scores[primary],
+            "confidence": rng.randint(55, 90),
+            "key_sentences": [
+                {"sentence": sentence[:300], "importance_score": round(rng.uniform(0.4, 0.9), 2)}
+                for sentence in sentences
+            ],
+            "explanation": f"Mock assessment of {entity or 'the entity'}: {primary.replace('_', ' ')} signal "
+                           f"{scores[primary]}/100 from lexicon hits in the article."[:800]
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local mock of the OpenRouter chat-completions API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8088)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=500.0)
+    parser.add_argument("--latency-spread", type=float, default=0.4)
+    parser.add_argument("--ms-per-output-token", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    server = MockLLMServer(
+        host=args.host, port=args.port, latency=args.latency, latency_ms=args.latency_ms,
+        latency_spread=args.latency_spread, ms_per_output_token=args.ms_per_output_token,
+        rate_limit_rate=args.rate_limit_rate, error_rate=args.error_rate, retry_after=args.retry_after,
+        max_concurrency=args.max_concurrency, seed=args.seed
+    )
+    print(f"Mock LLM listening on {server.url}", flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
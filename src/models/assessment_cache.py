@@ -0,0 +1,122 @@
+"""
+Persistent assessment cache for AdverseMediaScreener
+- SQLite file keyed by a content hash of article text + entity + model + prompt version
+- Bulk lookups and batched writes so a screening costs one query each way
+- LRU eviction once the entry budget is exceeded
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List
+
+# SQLite caps the number of bound parameters per statement
+_SQL_CHUNK = 500
+
+
+class AssessmentCache:
+    def __init__(self, path: str = "data/assessments.db", max_entries: int = 100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS assessments (
+                key TEXT PRIMARY KEY,
+                assessment TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_assessments_lru ON assessments(last_accessed)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(article_text: str, entity_name: str, model: str, prompt_version: str) -> str:
+        """Content hash of the normalized article plus everything that changes the model output."""
+        normalized = re.sub(r"\s+", " ", article_text).strip().lower()
+        entity = entity_name.strip().lower()
+        key_string = "\x1f".join([prompt_version, model, entity, normalized])
+        return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        """Return cached assessment dicts for the keys that are present."""
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique_keys), _SQL_CHUNK):
+                chunk = unique_keys[start:start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, assessment FROM assessments WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, payload in rows:
+                    found[key] = json.loads(payload)
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE assessments SET last_accessed = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, items: Dict[str, Dict]):
+        """Write assessments in one transaction, then evict least recently used entries."""
+        if not items:
+            return
+        now = time.time()
+        rows = [(key, json.dumps(assessment), now, now) for key, assessment in items.items()]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO assessments (key, assessment, created_at, last_accessed) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._evict()
+
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM assessments WHERE key IN "
+                "(SELECT key FROM assessments ORDER BY last_accessed ASC LIMIT ?)",
+                (excess,)
+            )
+            self.evictions += excess
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM assessments").fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "size_bytes": sum(
+                os.path.getsize(path) for path in (self.path, f"{self.path}-wal") if os.path.exists(path)
+            ),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions
+        }
+
+    def clear(self):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM assessments")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
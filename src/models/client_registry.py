@@ -0,0 +1,89 @@
+"""
+Process-wide registry of LLM clients
+- One instructor-wrapped OpenAI client per (model, endpoint, credentials) for the whole process
+- Tuned httpx connection pool with keep-alive so TLS sessions survive across screenings
+- Safe to call from worker threads and from every Streamlit session
+"""
+import asyncio
+import json
+import os
+import threading
+import weakref
+from typing import Dict
+
+import httpx
+import instructor
+from openai import AsyncOpenAI, OpenAI
+
+_lock = threading.Lock()
+_clients: Dict[str, instructor.Instructor] = {}
+# Async pools are bound to the event loop that created them
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = weakref.WeakKeyDictionary()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "64")),
+        max_keepalive_connections=int(os.getenv("LLM_MAX_KEEPALIVE", "32")),
+        keepalive_expiry=float(os.getenv("LLM_KEEPALIVE_EXPIRY", "90"))
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        connect=float(os.getenv("LLM_CONNECT_TIMEOUT", "10")),
+        read=float(os.getenv("LLM_READ_TIMEOUT", "120")),
+        write=30.0,
+        pool=30.0
+    )
+
+
+def _registry_key(model: str, client_kwargs: Dict) -> str:
+    return json.dumps({"model": model, **client_kwargs}, sort_keys=True, default=str)
+
+
+def get_client(model: str, **client_kwargs) -> instructor.Instructor:
+    """Shared instructor client for model; client_kwargs are passed to OpenAI()."""
+    key = _registry_key(model, client_kwargs)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            http_client = httpx.Client(limits=_limits(), timeout=_timeout())
+            client = instructor.from_openai(OpenAI(http_client=http_client, **client_kwargs))
+            _clients[key] = client
+        return client
+
+
+def get_async_client(model: str, **client_kwargs) -> instructor.AsyncInstructor:
+    """Shared async instructor client for model on the running event loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop yet: hand out a private client rather than pinning one to a dead loop
+        return instructor.from_openai(AsyncOpenAI(**client_kwargs))
+    key = _registry_key(model, client_kwargs)
+    with _lock:
+        loop_clients = _async_clients.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            http_client = httpx.AsyncClient(limits=_limits(), timeout=_timeout())
+            client = instructor.from_openai(AsyncOpenAI(http_client=http_client, **client_kwargs))
+            loop_clients[key] = client
+        return client
+
+
+def registry_stats() -> Dict:
+    with _lock:
+        return {
+            "sync_clients": len(_clients),
+            "async_clients": sum(len(clients) for clients in _async_clients.values())
+        }
+
+
+def close_all():
+    """Close pooled sync connections (e.g. on shutdown or in tests)."""
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.client.close()
@@ -0,0 +1,251 @@
+"""
+Compact storage for screening results
+- Category scores, overall_severity and confidence packed into one int8 matrix
+- source / primary_risk / model / model_tier kept once in an interned string table
+- Per-article text fields in __slots__ records instead of 15-key dicts; cluster_id is an int32
+  column (-1 for none) and evidence_spans a tuple of (start, end) pairs, so the usual record
+  needs no per-row dict
+- AssessmentView gives existing callers the same read-only dict interface
+"""
+import sys
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from .triage import RISK_CATEGORIES
+
+# Column order of the packed score matrix
+SCORE_FIELDS = [*RISK_CATEGORIES, "overall_severity", "confidence"]
+# Low-cardinality strings stored as indices into the shared string table
+SYMBOL_FIELDS = ["primary_risk", "source", "model", "model_tier"]
+TEXT_FIELDS = ["article_url", "article_title", "publish_date", "explanation"]
+# Key order of the dicts built by AdverseMediaScreener._assessment_record
+RECORD_FIELDS = [*RISK_CATEGORIES, "primary_risk", "overall_severity", "confidence", "key_sentences", "explanation",
+                 "article_url", "article_title", "publish_date", "source", "model", "model_tier"]
+
+_SCORE_COLUMNS = {field: i for i, field in enumerate(SCORE_FIELDS)}
+_SYMBOL_COLUMNS = {field: i for i, field in enumerate(SYMBOL_FIELDS)}
+_KNOWN_FIELDS = {*RECORD_FIELDS, "cluster_id", "evidence_spans"}
+# Symbol index for a missing value (e.g. model is None for triaged articles)
+_NONE_SYMBOL = 0
+
+
+class _ArticleText:
+    __slots__ = ("article_url", "article_title", "publish_date", "explanation", "key_sentences", "evidence_spans", "extra")
+
+    def __init__(self, article_url: str, article_title: str, publish_date: str, explanation: str, key_sentences: tuple,
+                 evidence_spans: tuple = None, extra: Dict = None):
+        self.article_url = article_url
+        self.article_title = article_title
+        self.publish_date = publish_date
+        self.explanation = explanation
+        # ((sentence, importance_score), ...)
+        self.key_sentences = key_sentences
+        # ((start, end) or None per key sentence), None when the record has no evidence_spans
+        self.evidence_spans = evidence_spans
+        # Keys outside the known fields, None for the usual record
+        self.extra = extra
+
+
+class AssessmentView(Mapping):
+    """Read-only dict view of one row of a CompactAssessments."""
+    __slots__ = ("_owner", "_row")
+
+    def __init__(self, owner: "CompactAssessments", row: int):
+        self._owner = owner
+        self._row = row
+
+    def __getitem__(self, key):
+        return self._owner._value(self._row, key)
+
+    def __iter__(self):
+        return iter(self._owner._keys(self._row))
+
+    def __len__(self):
+        return len(self._owner._keys(self._row))
+
+    def __eq__(self, other):
+        if isinstance(other, AssessmentView):
+            return self._owner is other._owner and self._row == other._row
+        return Mapping.__eq__(self, other)
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return f"AssessmentView({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict:
+        return {key: self[key] for key in self}
+
+
+class CompactAssessments(Sequence):
+    """
+    Immutable, array-backed list of assessment records.
+    Indexing returns AssessmentView objects, so code written against the list of dicts
+    (a.get("overall_severity", 0), a["article_title"], sorting, iteration) keeps working.
+    """
+
+    def __init__(self, records: Iterable[Mapping] = ()):
+        records = list(records)
+        self._strings: List[str] = [None]
+        self._string_ids: Dict[str, int] = {}
+        self.scores = np.zeros((len(records), len(SCORE_FIELDS)), dtype=np.int8)
+        symbols = np.zeros((len(records), len(SYMBOL_FIELDS)), dtype=np.int32)
+        self.cluster_ids = np.full(len(records), -1, dtype=np.int32)
+        self._texts: List[_ArticleText] = []
+        span_tuples: Dict[tuple, tuple] = {}
+        for row, record in enumerate(records):
+            self.scores[row] = [record.get(field, 0) for field in SCORE_FIELDS]
+            symbols[row] = [self._symbol(record.get(field)) for field in SYMBOL_FIELDS]
+            if record.get("cluster_id") is not None:
+                self.cluster_ids[row] = record["cluster_id"]
+            extra = {key: value for key, value in record.items() if key not in _KNOWN_FIELDS}
+            self._texts.append(_ArticleText(
+                record.get("article_url", ""),
+                record.get("article_title", ""),
+                record.get("publish_date", ""),
+                record.get("explanation", ""),
+                tuple((s["sentence"], s["importance_score"]) for s in record.get("key_sentences", [])),
+                _intern_spans(record.get("evidence_spans"), span_tuples),
+                extra or None
+            ))
+        # Narrowest index type that fits the string table (usually a handful of sources)
+        self.symbols = symbols.astype(np.uint8 if len(self._strings) <= 0xFF else np.uint16 if len(self._strings) <= 0xFFFF else np.uint32)
+
+    def _symbol(self, value) -> int:
+        if value is None:
+            return _NONE_SYMBOL
+        symbol = self._string_ids.get(value)
+        if symbol is None:
+            symbol = self._string_ids[value] = len(self._strings)
+            self._strings.append(sys.intern(value))
+        return symbol
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [AssessmentView(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("assessment index out of range")
+        return AssessmentView(self, index)
+
+    def _keys(self, row: int) -> List[str]:
+        text = self._texts[row]
+        keys = RECORD_FIELDS
+        if self.cluster_ids[row] >= 0:
+            keys = [*keys, "cluster_id"]
+        if text.evidence_spans is not None:
+            keys = [*keys, "evidence_spans"]
+        return [*keys, *text.extra] if text.extra else keys
+
+    def _value(self, row: int, key: str):
+        if key in _SCORE_COLUMNS:
+            return int(self.scores[row, _SCORE_COLUMNS[key]])
+        if key in _SYMBOL_COLUMNS:
+            return self._strings[self.symbols[row, _SYMBOL_COLUMNS[key]]]
+        text = self._texts[row]
+        if key in TEXT_FIELDS:
+            return getattr(text, key)
+        if key == "key_sentences":
+            return [{"sentence": sentence, "importance_score": score} for sentence, score in text.key_sentences]
+        if key == "cluster_id" and self.cluster_ids[row] >= 0:
+            return int(self.cluster_ids[row])
+        if key == "evidence_spans" and text.evidence_spans is not None:
+            return [list(span) if span else None for span in text.evidence_spans]
+        if text.extra and key in text.extra:
+            return text.extra[key]
+        raise KeyError(key)
+
+    def column(self, field: str) -> np.ndarray:
+        """All values of one score field, e.g. column("overall_severity")."""
+        return self.scores[:, _SCORE_COLUMNS[field]].astype(np.int16)
+
+    def symbol_mask(self, field: str, value: str) -> np.ndarray:
+        """bool per record: field equals value, e.g. symbol_mask("model_tier", "triage")."""
+        symbol = _NONE_SYMBOL if value is None else self._string_ids.get(value)
+        if symbol is None:
+            return np.zeros(len(self), dtype=bool)
+        return self.symbols[:, _SYMBOL_COLUMNS[field]] == symbol
+
+    def text_prefix_mask(self, field: str, prefix: str) -> np.ndarray:
+        """bool per record: text field starts with prefix, e.g. text_prefix_mask("explanation", FALLBACK_PREFIX)."""
+        return np.fromiter((getattr(text, field).startswith(prefix) for text in self._texts), dtype=bool, count=len(self))
+
+    def to_dicts(self) -> List[Dict]:
+        return [view.to_dict() for view in self]
+
+    def memory_footprint(self) -> Dict:
+        """Approximate bytes held by this container, by part."""
+        seen = set()
+        strings_bytes = _deep_size(self._strings, seen)
+        text_bytes = sys.getsizeof(self._texts)
+        for text in self._texts:
+            text_bytes += sys.getsizeof(text) + sum(_deep_size(getattr(text, slot), seen) for slot in _ArticleText.__slots__)
+        footprint = {
+            "records": len(self),
+            "scores_bytes": self.scores.nbytes,
+            "symbols_bytes": self.symbols.nbytes + self.cluster_ids.nbytes,
+            "strings_bytes": strings_bytes,
+            "text_bytes": text_bytes
+        }
+        footprint["total_bytes"] = sum(v for k, v in footprint.items() if k.endswith("_bytes"))
+        return footprint
+
+
+def _intern_spans(spans, seen: Dict[tuple, tuple]):
+    """evidence_spans as a tuple of (start, end) / None; spans repeat across cluster members, so equal ones share a tuple."""
+    if spans is None:
+        return None
+    spans = tuple(tuple(span) if span else None for span in spans)
+    return seen.setdefault(spans, spans)
+
+
+def _deep_size(value, seen: set = None) -> int:
+    """sys.getsizeof including the contents of dicts, lists and tuples."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(_deep_size(v, seen) for v in value)
+    return size
+
+
+def records_footprint(records: List[Dict]) -> int:
+    """Approximate bytes held by a plain list of assessment dicts, for comparison."""
+    return _deep_size(records)
+
+
+def compact_result(result: Dict) -> Dict:
+    """
+    Copy of a screen_entity result with all_assessments stored as CompactAssessments
+    and high_risk_articles as views into it (no duplicated records).
+    """
+    assessments = result.get("all_assessments")
+    if assessments is None or isinstance(assessments, CompactAssessments):
+        return result
+    compact = CompactAssessments(assessments)
+    row_of = {id(record): row for row, record in enumerate(assessments)}
+    high_risk = []
+    for record in result.get("high_risk_articles", []):
+        row = row_of.get(id(record))
+        # High-risk entries are normally the same dict objects as in all_assessments
+        high_risk.append(compact[row] if row is not None else record)
+    return {**result, "all_assessments": compact, "high_risk_articles": high_risk}
+
+
+def json_default(value):
+    """json.dumps default= hook that serializes compact results as plain lists/dicts."""
+    if isinstance(value, CompactAssessments):
+        return value.to_dicts()
+    if isinstance(value, AssessmentView):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
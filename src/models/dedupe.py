@@ -0,0 +1,89 @@
+"""
+Near-duplicate article clustering before screening
+- 64-bit SimHash over word unigrams + bigrams of title + content
+- Banded LSH buckets so only likely duplicates are compared (linear in article count)
+- Syndicated copies of one wire story collapse onto a single representative
+"""
+import hashlib
+import re
+from typing import Dict, List
+
+import numpy as np
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"https?://\S+")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+# Google News titles end in " - Publisher"; syndicated copies differ only there
+_PUBLISHER_SUFFIX_RE = re.compile(r"\s+-\s+[^-]+$")
+
+
+def _features(text: str) -> List[bytes]:
+    words = _WORD_RE.findall(text.lower())
+    bigrams = [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return [feature.encode("utf-8") for feature in words + bigrams]
+
+
+def simhash(text: str) -> int:
+    features = _features(text)
+    if not features:
+        return 0
+    digests = b"".join(hashlib.blake2b(feature, digest_size=8).digest() for feature in features)
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1)
+    # Majority vote per bit position across all features
+    fingerprint_bits = (bits.sum(axis=0) * 2 > len(features)).astype(np.uint8)
+    return int.from_bytes(np.packbits(fingerprint_bits).tobytes(), "big")
+
+
+class NearDuplicateClusterer:
+    """
+    Groups articles whose SimHash fingerprints differ in at most max_distance bits.
+    Fingerprints are split into max_distance + 1 bands; by pigeonhole any pair within
+    the distance shares at least one identical band, so only bucket-mates are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = max_distance + 1
+        self.band_bits = 64 // self.bands
+
+    def article_text(self, article: Dict) -> str:
+        title = _PUBLISHER_SUFFIX_RE.sub("", article.get("title", ""))
+        content = _URL_RE.sub(" ", _TAG_RE.sub(" ", article.get("content", "")))
+        return f"{title}\n{content}"
+
+    def cluster(self, articles: List[Dict]) -> List[int]:
+        """Return a cluster id per article: the index of the first article in its cluster."""
+        fingerprints = [simhash(self.article_text(article)) for article in articles]
+        parent = list(range(len(articles)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i: int, j: int):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Keep the earliest article as the root so ids are stable
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        # Identical fingerprints join directly; only distinct ones go through LSH
+        first_by_fingerprint = {}
+        for i, fingerprint in enumerate(fingerprints):
+            if fingerprint in first_by_fingerprint:
+                union(first_by_fingerprint[fingerprint], i)
+            else:
+                first_by_fingerprint[fingerprint] = i
+
+        mask = (1 << self.band_bits) - 1
+        buckets = {}
+        for fingerprint, i in first_by_fingerprint.items():
+            for band in range(self.bands):
+                key = (band, (fingerprint >> (band * self.band_bits)) & mask)
+                for j in buckets.get(key, ()):
+                    if bin(fingerprint ^ fingerprints[j]).count("1") <= self.max_distance:
+                        union(i, j)
+                buckets.setdefault(key, []).append(i)
+
+        return [find(i) for i in range(len(articles))]
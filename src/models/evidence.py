@@ -0,0 +1,186 @@
+"""
+Local evidence-sentence preselection before the LLM call
+- Splits an article into sentences with their character offsets
+- Ranks sentences by entity mentions and risk-lexicon hits (neighbours of a hit get part of its score)
+- Keeps the top-k sentences that fit a token budget, in article order
+- Texts already within the budget are sent unchanged (e.g. RSS snippets)
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .prompts import CHARS_PER_TOKEN
+from .triage import RiskTriage
+
+ENTITY_FULL_WEIGHT = 2.0
+ENTITY_PART_WEIGHT = 1.0
+# Share of a sentence's score given to the sentences right before and after it
+NEIGHBOUR_WEIGHT = 0.5
+LEAD_WEIGHT = 0.25
+# Bump when sentence splitting or scoring changes so cached assessments of older selections are not reused
+SELECTION_VERSION = 2
+# Joins selected sentences in the prompt; marks where text was left out
+GAP_MARKER = " […] "
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) followed by whitespace
+# and an upper-case letter, digit or opening quote; blank lines always end a sentence
+_BOUNDARY_RE = re.compile(r"(?<=[.!?])[\"'”’)\]]*\s+(?=[A-Z0-9\"'“‘(\[])|\n\s*\n|\n(?=\s*[-•*])")
+# Tokens that end with a period without ending the sentence ("Mr. Smith", "Acme Corp. said")
+_ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "ft", "gen", "gov", "sen", "rep", "lt", "col", "capt", "sgt",
+    "inc", "corp", "co", "ltd", "plc", "llc", "bros", "dept", "no", "vs", "approx", "est",
+    "jan", "feb", "mar", "apr", "aug", "sep", "sept", "oct", "nov", "dec",
+}
+# Word ending right before a period; dotted forms ("U.S", "e.g") are kept whole
+_WORD_BEFORE_PERIOD_RE = re.compile(r"([A-Za-z]+(?:\.[A-Za-z]+)*)\.$")
+_NAME_SUFFIXES = {"inc", "inc.", "corp", "corp.", "co", "co.", "ltd", "ltd.", "plc", "llc", "group", "the", "&"}
+
+
+def _ends_with_abbreviation(text: str, end: int) -> bool:
+    """True when the period just before end belongs to an abbreviation or an initial, not a sentence end."""
+    match = _WORD_BEFORE_PERIOD_RE.search(text, max(0, end - 24), end)
+    if match is None:
+        return False
+    word = match.group(1)
+    # Single-letter initials ("J. Smith") and dotted abbreviations ("U.S.")
+    return word.lower() in _ABBREVIATIONS or len(word) == 1 or "." in word
+
+
+def split_sentences(text: str) -> List[Tuple[int, int]]:
+    """(start, end) character offsets of each sentence in text, whitespace trimmed."""
+    spans = []
+    start = 0
+    for boundary in [*_BOUNDARY_RE.finditer(text), None]:
+        # A period after "Mr"/"Corp"/an initial is not a boundary, unless a blank line follows
+        if (boundary is not None and boundary.group(0).count("\n") < 2 and boundary.start() > 0
+                and text[boundary.start() - 1] == "." and _ends_with_abbreviation(text, boundary.start())):
+            continue
+        end = boundary.start() if boundary is not None else len(text)
+        if boundary is not None and text[boundary.start()] in "\"'”’)]":
+            # Keep closing quotes/brackets with the sentence they close
+            end += len(boundary.group(0)) - len(boundary.group(0).lstrip("\"'”’)]"))
+        segment = text[start:end]
+        stripped = segment.strip()
+        if stripped:
+            offset = start + len(segment) - len(segment.lstrip())
+            spans.append((offset, offset + len(stripped)))
+        if boundary is not None:
+            start = boundary.end()
+    return spans
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class EvidenceSelection:
+    """Text to send to the model plus where each kept sentence sits in the original article."""
+    __slots__ = ("text", "sentences", "original_tokens", "selected_tokens")
+
+    def __init__(self, text: str, sentences: List[Dict], original_tokens: int, selected_tokens: int):
+        self.text = text
+        # [{"start", "end", "score"}] in article order; offsets index the original text
+        self.sentences = sentences
+        self.original_tokens = original_tokens
+        self.selected_tokens = selected_tokens
+
+    @property
+    def truncated(self) -> bool:
+        return self.selected_tokens < self.original_tokens
+
+
+class EvidenceSelector:
+    """
+    Picks the sentences most likely to carry adverse-media evidence.
+    token_budget caps the selected text; top_k caps the number of sentences.
+    """
+
+    def __init__(self, token_budget: int = 600, top_k: int = 12, triage: RiskTriage = None):
+        self.token_budget = token_budget
+        self.top_k = top_k
+        self.triage = triage or RiskTriage()
+
+    def cache_tag(self) -> str:
+        """Identifies the selection settings in cache keys."""
+        return f"evidence{SELECTION_VERSION}-{self.token_budget}x{self.top_k}"
+
+    def sentence_scores(self, sentences: List[str], entity_name: str) -> np.ndarray:
+        """Relevance score per sentence: entity mentions + lexicon weight, spread to neighbours."""
+        lexicon = self.triage.signal_matrix(sentences).sum(axis=1) if sentences else np.zeros(0)
+        full_name, name_parts = self._entity_patterns(entity_name)
+        entity = np.array([
+            ENTITY_FULL_WEIGHT if full_name.search(s) else ENTITY_PART_WEIGHT if name_parts and name_parts.search(s) else 0.0
+            for s in sentences
+        ])
+        # A risk phrase counts most when the sentence also names the entity
+        direct = lexicon * (1.0 + (entity > 0)) + entity
+        scores = direct.copy()
+        if len(direct) > 1:
+            scores[1:] += NEIGHBOUR_WEIGHT * direct[:-1]
+            scores[:-1] += NEIGHBOUR_WEIGHT * direct[1:]
+        if len(scores):
+            scores[0] += LEAD_WEIGHT
+        return scores
+
+    def select(self, text: str, entity_name: str) -> EvidenceSelection:
+        original_tokens = _estimate_tokens(text)
+        spans = split_sentences(text)
+        if original_tokens <= self.token_budget and len(spans) <= self.top_k:
+            return EvidenceSelection(text, [{"start": s, "end": e, "score": None} for s, e in spans], original_tokens, original_tokens)
+        sentences = [text[s:e] for s, e in spans]
+        scores = self.sentence_scores(sentences, entity_name)
+        chosen, used = [], 0
+        # Highest score first; ties keep article order
+        for i in sorted(range(len(spans)), key=lambda i: (-scores[i], i)):
+            tokens = _estimate_tokens(sentences[i])
+            if used + tokens > self.token_budget:
+                continue
+            chosen.append(i)
+            used += tokens
+            if len(chosen) >= self.top_k:
+                break
+        if not chosen and spans:
+            # A single sentence longer than the budget: send its beginning
+            first = int(np.argmax(scores))
+            start, end = spans[first]
+            end = min(end, start + self.token_budget * CHARS_PER_TOKEN)
+            spans[first], sentences[first] = (start, end), text[start:end]
+            chosen, used = [first], _estimate_tokens(sentences[first])
+        chosen.sort()
+        parts = []
+        for position, i in enumerate(chosen):
+            if position and chosen[position - 1] != i - 1:
+                parts.append(GAP_MARKER)
+            elif position:
+                parts.append(" ")
+            parts.append(sentences[i])
+        if chosen and chosen[-1] != len(spans) - 1:
+            parts.append(GAP_MARKER.rstrip())
+        return EvidenceSelection(
+            "".join(parts),
+            [{"start": spans[i][0], "end": spans[i][1], "score": round(float(scores[i]), 3)} for i in chosen],
+            original_tokens,
+            used
+        )
+
+    @staticmethod
+    def locate(text: str, sentence: str) -> Optional[Tuple[int, int]]:
+        """Character offsets of a quoted key sentence in the original text (whitespace/case tolerant)."""
+        sentence = sentence.strip().strip("\"'“”")
+        if not sentence:
+            return None
+        start = text.find(sentence)
+        if start >= 0:
+            return start, start + len(sentence)
+        words = [re.escape(word) for word in sentence.split()]
+        match = re.search(r"\s+".join(words), text, re.IGNORECASE) if words else None
+        return (match.start(), match.end()) if match else None
+
+    @staticmethod
+    def _entity_patterns(entity_name: str):
+        words = entity_name.split()
+        full_name = re.compile(r"\b" + r"\s+".join(re.escape(w) for w in words) + r"\b", re.IGNORECASE) if words else re.compile(r"(?!)")
+        parts = [w for w in words if w.lower() not in _NAME_SUFFIXES and len(w) > 2]
+        name_parts = re.compile(r"\b(?:" + "|".join(re.escape(w) for w in parts) + r")\b", re.IGNORECASE) if len(words) > 1 and parts else None
+        return full_name, name_parts
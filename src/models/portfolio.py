@@ -0,0 +1,114 @@
+"""
+Vectorized portfolio-level aggregation of article assessments
+- Works on an (articles x categories) int matrix plus an entity segment index, taken straight
+  from the CompactAssessments score matrices kept for each screening
+- Same mean / max / spike-blend rules as AdverseMediaScreener._aggregate_assessments,
+  computed for every entity in one pass with NumPy reductions
+"""
+from typing import Dict, List
+
+import numpy as np
+
+from .compact_results import SCORE_FIELDS, CompactAssessments
+from .screener import FALLBACK_PREFIX
+from .triage import NO_PRIMARY_RISK, RISK_CATEGORIES
+
+# Same constants as the per-entity aggregation
+SPIKE_SPREAD = 20
+SPIKE_MAX_WEIGHT = 0.6
+SPIKE_MEAN_WEIGHT = 0.4
+HIGH_RISK_THRESHOLD = 50
+SEVERITY_COLUMN = SCORE_FIELDS.index("overall_severity")
+
+
+def portfolio_matrix(results: List[CompactAssessments]):
+    """
+    Stack the packed score matrices of several screenings, one CompactAssessments per entity
+    (compact_result(result)["all_assessments"]), without going through per-article dicts
+    Returns (scores int8[articles, categories], severity int8[articles], segments int32[articles],
+    routine bool[articles]: True for triaged-out assessments)
+    Fallback records (calls that failed) get zero scores and count as routine, so they drop out of
+    the aggregate the same way _aggregate_assessments skips them.
+    """
+    n_categories = len(RISK_CATEGORIES)
+    if not results:
+        return (np.zeros((0, n_categories), dtype=np.int8), np.zeros(0, dtype=np.int8), np.zeros(0, dtype=np.int32),
+                np.zeros(0, dtype=bool))
+    scores = np.concatenate([r.scores[:, :n_categories] for r in results])
+    severity = np.concatenate([r.scores[:, SEVERITY_COLUMN] for r in results])
+    segments = np.repeat(np.arange(len(results), dtype=np.int32), [len(r) for r in results])
+    routine = np.concatenate([r.symbol_mask("model_tier", "triage") for r in results])
+    fallback = np.concatenate([r.text_prefix_mask("explanation", FALLBACK_PREFIX) for r in results])
+    scores[fallback] = 0
+    severity[fallback] = 0
+    return scores, severity, segments, routine | fallback
+
+
+def aggregate_portfolio(scores: np.ndarray, severity: np.ndarray, segments: np.ndarray, n_entities: int = None,
+                        routine: np.ndarray = None) -> Dict[str, np.ndarray]:
+    """
+    Aggregate article scores into per-entity results
+    - risk_scores: int[entities, categories]
+    - overall_severity: int[entities]; primary_risk: index into RISK_CATEGORIES per entity,
+      -1 (NO_PRIMARY_RISK) when every article of the entity is routine (see portfolio_matrix)
+    - high_risk_mask: bool[articles] (article overall_severity > 50); high_risk_counts: int[entities]
+    Entities without articles get zeros.
+    """
+    scores = np.asarray(scores)
+    severity = np.asarray(severity)
+    segments = np.asarray(segments)
+    if n_entities is None:
+        n_entities = int(segments.max()) + 1 if segments.size else 0
+    n_categories = scores.shape[1] if scores.ndim == 2 else len(RISK_CATEGORIES)
+    risk_scores = np.zeros((n_entities, n_categories), dtype=np.int64)
+    high_risk_mask = severity > HIGH_RISK_THRESHOLD
+    high_risk_counts = np.bincount(segments, weights=high_risk_mask, minlength=n_entities).astype(np.int64)
+
+    if segments.size:
+        order = np.argsort(segments, kind="stable")
+        sorted_segments = segments[order]
+        sorted_scores = scores[order].astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, sorted_segments[1:] != sorted_segments[:-1]])
+        entity_ids = sorted_segments[starts]
+
+        # Zero scores are ignored, as in the per-entity function
+        positive = sorted_scores > 0
+        counts = np.add.reduceat(positive, starts, axis=0)
+        sums = np.add.reduceat(np.where(positive, sorted_scores, 0), starts, axis=0)
+        maxima = np.maximum.reduceat(np.where(positive, sorted_scores, -1), starts, axis=0)
+        minima = np.minimum.reduceat(np.where(positive, sorted_scores, np.iinfo(np.int32).max), starts, axis=0)
+
+        has_scores = counts > 0
+        means = sums // np.maximum(counts, 1)
+        spike = has_scores & (maxima - minima > SPIKE_SPREAD)
+        blended = (SPIKE_MAX_WEIGHT * maxima + SPIKE_MEAN_WEIGHT * means).astype(np.int64)
+        risk_scores[entity_ids] = np.where(spike, blended, np.where(has_scores, means, 0))
+
+    overall_severity = risk_scores.max(axis=1) if n_categories else np.zeros(n_entities, dtype=np.int64)
+    # argmax returns the first maximum, matching max(dict, key=...) over RISK_CATEGORIES order
+    primary_risk = risk_scores.argmax(axis=1)
+    if routine is not None and segments.size:
+        model_scored = np.bincount(segments, weights=~np.asarray(routine, dtype=bool), minlength=n_entities)
+        article_counts = np.bincount(segments, minlength=n_entities)
+        primary_risk = np.where((article_counts > 0) & (model_scored == 0), -1, primary_risk)
+    return {
+        "risk_scores": risk_scores,
+        "overall_severity": overall_severity,
+        "primary_risk": primary_risk,
+        "high_risk_mask": high_risk_mask,
+        "high_risk_counts": high_risk_counts
+    }
+
+
+def portfolio_summaries(entity_names: List[str], aggregated: Dict[str, np.ndarray]) -> List[Dict]:
+    """Per-entity dicts shaped like the score fields of screen_entity's result."""
+    return [
+        {
+            "entity_name": name,
+            "overall_severity": int(aggregated["overall_severity"][i]),
+            "primary_risk": RISK_CATEGORIES[int(aggregated["primary_risk"][i])] if aggregated["primary_risk"][i] >= 0 else NO_PRIMARY_RISK,
+            "risk_scores": dict(zip(RISK_CATEGORIES, aggregated["risk_scores"][i].tolist())),
+            "high_risk_count": int(aggregated["high_risk_counts"][i])
+        }
+        for i, name in enumerate(entity_names)
+    ]
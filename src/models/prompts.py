@@ -0,0 +1,123 @@
+"""
+Versioned prompt templates for AdverseMediaScreener
+- v2 (current): static, byte-identical rubric in the system message + small per-article user message
+- Provider-side prefix caching is not used: the rubric is ~440 tokens (~285 for batches, ~600 if
+  the two were merged into one shared block), below the 1024-token minimum cacheable prefix, so no
+  cache breakpoint is sent. Padding the rubric to qualify would cost more than it saves
+- v1: original layout with entity/article interpolated into the middle of the rubric
+"""
+from typing import Dict, List
+
+# Bump whenever a template changes so cached assessments from older prompts are not reused
+PROMPT_VERSION = "v2"
+# Rough chars-per-token ratio for sizing prompts and text without a tokenizer
+CHARS_PER_TOKEN = 4
+
+SYSTEM_PROMPT = "You are a professional, realistic banking compliance analyst. Avoid flat or identical category scores except with explicit evidence."
+
+SCORING_GUIDELINES = """SCORING GUIDELINES:
+- 11–29: Routine, neutral coverage (minor lawsuits, regular ops, no flagged events)
+- 30–40: Weak signals, one-off or indirect mentions (e.g., mention of compliance efforts)
+- 41–60: Moderate risk (pending lawsuits with media coverage, warnings, non-criminal fines)
+- 61–80: Strong evidence (major fines, criminal charges, ongoing regulatory actions)
+- 81–100: Major proven event (criminal conviction/fines, bankruptcy, systemic fraud)"""
+
+JSON_STRUCTURE = """JSON STRUCTURE:
+{
+  "fraud": (int, 0–100),
+  "sanctions": (int, 0–100),
+  "money_laundering": (int, 0–100),
+  "bribery_corruption": (int, 0–100),
+  "cyber_incident": (int, 0–100),
+  "insolvency": (int, 0–100),
+  "esg_violation": (int, 0–100),
+  "primary_risk": "string",
+  "overall_severity": (int, 0–100),
+  "confidence": (int, 0–100),
+  "key_sentences": [{"sentence": "...", "importance_score": float}],
+  "explanation": "brief explanation, cite article details"
+}"""
+
+_V1_ARTICLE = """
+You are a professional banking compliance analyst. Score the entity in 7 risk categories based on the ARTICLE below.
+Routine news gets scores in the 11-29 range—use natural, slightly different values per category. If weak signals or indirect relevance is present, use 30-40. Moderate/strong/critical risk follows guidance below.
+Never use identical values across all categories unless literally equally relevant. Mimic human judgment: for routine news, mix values (e.g., 13, 19, 23, 16, etc.).
+
+Only give higher scores where Article gives clear evidence. Summarize reasons and cite supporting sentences.
+
+ENTITY: {entity_name}
+
+ARTICLE:
+{body}
+
+""" + SCORING_GUIDELINES + """
+
+""" + JSON_STRUCTURE.replace("{", "{{").replace("}", "}}") + """
+Never include two identical scores for all categories by default. For routine news, randomize or differentiate the scores appropriately.
+"""
+
+_V1_BATCH = """
+You are a professional banking compliance analyst. Score the entity in 7 risk categories separately for EACH numbered ARTICLE below.
+Routine news gets scores in the 11-29 range—use natural, slightly different values per category. If weak signals or indirect relevance is present, use 30-40. Moderate/strong/critical risk follows guidance below.
+Never use identical values across all categories unless literally equally relevant. Score every article on its own evidence only.
+
+ENTITY: {entity_name}
+
+ARTICLES:
+{body}
+
+""" + SCORING_GUIDELINES + """
+
+Return exactly one assessment per article and set "article_index" to the number in brackets above the article.
+"""
+
+_V2_ARTICLE_RUBRIC = SYSTEM_PROMPT + """
+
+Score the ENTITY in 7 risk categories based on the ARTICLE in the user message.
+Routine news gets scores in the 11-29 range—use natural, slightly different values per category. If weak signals or indirect relevance is present, use 30-40. Moderate/strong/critical risk follows guidance below.
+Never use identical values across all categories unless literally equally relevant. Mimic human judgment: for routine news, mix values (e.g., 13, 19, 23, 16, etc.).
+
+Only give higher scores where Article gives clear evidence. Summarize reasons and cite supporting sentences.
+
+""" + SCORING_GUIDELINES + """
+
+""" + JSON_STRUCTURE + """
+Never include two identical scores for all categories by default. For routine news, randomize or differentiate the scores appropriately."""
+
+_V2_BATCH_RUBRIC = SYSTEM_PROMPT + """
+
+Score the ENTITY in 7 risk categories separately for EACH numbered ARTICLE in the user message.
+Routine news gets scores in the 11-29 range—use natural, slightly different values per category. If weak signals or indirect relevance is present, use 30-40. Moderate/strong/critical risk follows guidance below.
+Never use identical values across all categories unless literally equally relevant. Score every article on its own evidence only.
+
+""" + SCORING_GUIDELINES + """
+
+Return exactly one assessment per article and set "article_index" to the number in brackets above the article."""
+
+# version -> kind -> (static system rubric, variable user template); a None rubric means the
+# whole prompt is the user template (v1 layout) and SYSTEM_PROMPT is sent as the system message
+PROMPT_TEMPLATES = {
+    "v1": {
+        "article": (None, _V1_ARTICLE),
+        "batch": (None, _V1_BATCH),
+    },
+    "v2": {
+        "article": (_V2_ARTICLE_RUBRIC, "ENTITY: {entity_name}\n\nARTICLE:\n{body}"),
+        "batch": (_V2_BATCH_RUBRIC, "ENTITY: {entity_name}\n\nARTICLES:\n{body}"),
+    },
+}
+
+
+def build_messages(kind: str, entity_name: str, body: str, version: str = PROMPT_VERSION) -> List[Dict]:
+    """Chat messages for one call; kind is "article" or "batch"."""
+    rubric, template = PROMPT_TEMPLATES[version][kind]
+    user = {"role": "user", "content": template.format(entity_name=entity_name, body=body)}
+    return [{"role": "system", "content": rubric or SYSTEM_PROMPT}, user]
+
+
+def message_text(message: Dict) -> str:
+    """Plain text of a message whose content is a string or a list of text parts."""
+    content = message["content"]
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") for part in content)
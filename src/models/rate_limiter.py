@@ -0,0 +1,208 @@
+"""
+Adaptive rate limiting and retry scheduling for OpenRouter calls
+- Token buckets for requests/min and tokens/min shared by every caller
+- AIMD concurrency: +1/limit per success, halved on 429 / 5xx / timeouts
+- Jittered exponential backoff that honours Retry-After
+- Rate-limit and transient failures are told apart from permanent ones
+"""
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Dict
+
+import openai
+
+RATE_LIMIT = "rate_limit"
+TRANSIENT = "transient"
+PERMANENT = "permanent"
+
+_TRANSIENT_STATUS = {408, 409, 500, 502, 503, 504}
+# How long a caller waits before re-checking a full concurrency window
+_CONCURRENCY_POLL = 0.05
+
+
+class RetriesExhausted(Exception):
+    """A call kept failing with rate-limit or transient errors until retries ran out."""
+
+    def __init__(self, kind: str, last_error: Exception):
+        super().__init__(f"{kind} after retries: {last_error}")
+        self.kind = kind
+        self.last_error = last_error
+
+
+def _status_code(exc: Exception):
+    status = getattr(exc, "status_code", None)
+    if status is None and getattr(exc, "response", None) is not None:
+        status = getattr(exc.response, "status_code", None)
+    return status
+
+
+def classify_error(exc: Exception) -> str:
+    """Return RATE_LIMIT, TRANSIENT or PERMANENT, looking through wrapped causes."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, openai.RateLimitError) or _status_code(exc) == 429:
+            return RATE_LIMIT
+        status = _status_code(exc)
+        if isinstance(exc, (openai.APITimeoutError, openai.APIConnectionError, TimeoutError, ConnectionError)):
+            return TRANSIENT
+        if status is not None and (status in _TRANSIENT_STATUS or status >= 500):
+            return TRANSIENT
+        exc = exc.__cause__ or exc.__context__
+    return PERMANENT
+
+
+def _retry_after(exc: Exception):
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, requests_per_minute: int = 60, tokens_per_minute: int = 200_000,
+                 max_concurrency: int = 16, min_concurrency: int = 1,
+                 max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 30.0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.concurrency_limit = float(max_concurrency)
+        self.in_flight = 0
+        self._request_bucket = float(requests_per_minute)
+        self._token_bucket = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self._counters = {"calls": 0, "successes": 0, "rate_limited": 0, "transient_errors": 0,
+                          "permanent_errors": 0, "retries": 0, "exhausted": 0, "wait_seconds": 0.0}
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_bucket = min(self.requests_per_minute, self._request_bucket + elapsed * self.requests_per_minute / 60)
+        self._token_bucket = min(self.tokens_per_minute, self._token_bucket + elapsed * self.tokens_per_minute / 60)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take a slot and budget if available; otherwise return seconds to wait."""
+        tokens = min(tokens, self.tokens_per_minute)
+        with self._lock:
+            self._refill()
+            if self.in_flight >= int(self.concurrency_limit):
+                return _CONCURRENCY_POLL
+            request_deficit = 1 - self._request_bucket
+            token_deficit = tokens - self._token_bucket
+            if request_deficit > 0 or token_deficit > 0:
+                return max(request_deficit * 60 / self.requests_per_minute, token_deficit * 60 / self.tokens_per_minute)
+            self._request_bucket -= 1
+            self._token_bucket -= tokens
+            self.in_flight += 1
+            return 0.0
+
+    def acquire(self, tokens: int):
+        started = time.monotonic()
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                break
+            time.sleep(wait)
+        self._count("wait_seconds", time.monotonic() - started)
+
+    async def aacquire(self, tokens: int):
+        started = time.monotonic()
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+        self._count("wait_seconds", time.monotonic() - started)
+
+    def release(self, outcome: str):
+        """Free the slot and adapt concurrency (AIMD) to the call outcome."""
+        with self._lock:
+            self.in_flight -= 1
+            if outcome in (RATE_LIMIT, TRANSIENT):
+                self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit / 2)
+            elif outcome != PERMANENT:
+                self.concurrency_limit = min(self.max_concurrency, self.concurrency_limit + 1 / self.concurrency_limit)
+            if outcome == RATE_LIMIT:
+                # Provider says the window is spent: drain the request bucket too
+                self._request_bucket = min(self._request_bucket, 0.0)
+
+    def backoff_delay(self, attempt: int, exc: Exception) -> float:
+        """Retry-After when the provider sends one, else full-jitter exponential backoff."""
+        retry_after = _retry_after(exc)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def call(self, fn: Callable, tokens: int):
+        """Run fn under the limiter, retrying rate-limit/transient failures."""
+        for attempt in range(self.max_retries + 1):
+            self.acquire(tokens)
+            self._count("calls")
+            try:
+                result = fn()
+            except Exception as e:
+                kind = self._record_failure(e)
+                if kind == PERMANENT:
+                    raise
+                if attempt == self.max_retries:
+                    self._count("exhausted")
+                    raise RetriesExhausted(kind, e) from e
+                self._count("retries")
+                time.sleep(self.backoff_delay(attempt, e))
+                continue
+            self.release("success")
+            self._count("successes")
+            return result
+
+    async def acall(self, fn: Callable, tokens: int):
+        """Async counterpart of call; fn returns an awaitable."""
+        for attempt in range(self.max_retries + 1):
+            await self.aacquire(tokens)
+            self._count("calls")
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                self.release(PERMANENT)
+                raise
+            except Exception as e:
+                kind = self._record_failure(e)
+                if kind == PERMANENT:
+                    raise
+                if attempt == self.max_retries:
+                    self._count("exhausted")
+                    raise RetriesExhausted(kind, e) from e
+                self._count("retries")
+                await asyncio.sleep(self.backoff_delay(attempt, e))
+                continue
+            self.release("success")
+            self._count("successes")
+            return result
+
+    def _record_failure(self, exc: Exception) -> str:
+        kind = classify_error(exc)
+        self.release(kind)
+        self._count({RATE_LIMIT: "rate_limited", TRANSIENT: "transient_errors", PERMANENT: "permanent_errors"}[kind])
+        return kind
+
+    def _count(self, name: str, amount: float = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self._counters,
+                "wait_seconds": round(self._counters["wait_seconds"], 3),
+                "concurrency_limit": round(self.concurrency_limit, 2),
+                "in_flight": self.in_flight
+            }
@@ -1,18 +1,56 @@
 """
 AI-powered adverse media screening using OpenRouter
 REALISTIC/NUANCED VERSION – Nuanced scoring, calibrated, robust against flat outputs
+
+Single-article smoke test, run with src on the path:
+    PYTHONPATH=src python -m models.screener
 """
+import asyncio
+import hashlib
+import itertools
 import os
 import random
-from typing import Dict, List
-from pydantic import BaseModel, Field
-from openai import OpenAI
-import instructor
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing, nullcontext
+from typing import Dict, Iterator, List, Tuple
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from tenacity import AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt
 from dotenv import load_dotenv
 from datetime import datetime
 
+from models.client_registry import get_async_client, get_client
+from models.prompts import CHARS_PER_TOKEN, PROMPT_VERSION, build_messages, message_text
+from models.rate_limiter import PERMANENT, RATE_LIMIT, RetriesExhausted, classify_error
+from models.telemetry import Telemetry
+from models.triage import NO_PRIMARY_RISK
+from models.evidence import EvidenceSelector
+from utils.article_store import publish_timestamp
+
 load_dotenv()
 
+OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# Prefix of explanations produced by _fallback_assessment; these are never cached
+FALLBACK_PREFIX = "Fallback:"
+RATE_LIMITED_PREFIX = f"{FALLBACK_PREFIX} Rate limited"
+
+# Early stopping (screen_entity(early_stop=True)): screen at least this many articles, then
+# stop once the aggregated scores (as reported) stayed within +/- EARLY_STOP_TOLERANCE points
+# of their current values over the last EARLY_STOP_WINDOW model-scored articles
+EARLY_STOP_MIN_ARTICLES = 20
+EARLY_STOP_TOLERANCE = 3.0
+EARLY_STOP_WINDOW = 10
+HIGH_RISK_THRESHOLD = 50
+
+# Expected completion size of one article assessment, used for tokens/min budgeting
+COMPLETION_TOKENS_PER_ARTICLE = 400
+
+# instructor's attempts per call (its default); re-asks after schema validation failures
+REASK_ATTEMPTS = 3
+
+
 class SentenceEvidence(BaseModel):
     sentence: str
     importance_score: float = Field(ge=0, le=1)
@@ -31,105 +69,381 @@ class RiskAssessment(BaseModel):
     key_sentences: List[SentenceEvidence] = Field(max_length=3)
     explanation: str = Field(max_length=800)
 
+class IndexedRiskAssessment(RiskAssessment):
+    article_index: int = Field(ge=0)
+
+class BatchRiskAssessment(BaseModel):
+    assessments: List[IndexedRiskAssessment]
+
+    @field_validator("assessments", mode="before")
+    @classmethod
+    def _drop_invalid_items(cls, items):
+        # Keep the items that validate; the caller re-screens the rest one by one
+        valid = []
+        for item in items or []:
+            try:
+                valid.append(IndexedRiskAssessment.model_validate(item))
+            except ValidationError:
+                continue
+        return valid
+
 class AdverseMediaScreener:
-    def __init__(self, model: str = None):
+    def __init__(self, model: str = None, max_workers: int = None, batch_token_budget: int = None, max_batch_size: int = 10, cache=None, triage=None, deduper=None, rate_limiter=None,
+                 fast_model: str = None, escalate_severity: int = 40, escalate_confidence: int = 60,
+                 prompt_version: str = PROMPT_VERSION, base_url: str = None, telemetry_sink=None, evidence_selector=None):
+        # OpenAI-compatible endpoint; point at a local server (src/api/mock_llm.py) for offline load tests
+        self.base_url = base_url or os.getenv("LLM_BASE_URL", OPENROUTER_BASE_URL)
         self.api_key = os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
-            raise ValueError("OPENROUTER_API_KEY not found in .env file")
+            if self.base_url == OPENROUTER_BASE_URL:
+                raise ValueError("OPENROUTER_API_KEY not found in .env file")
+            # Local servers ignore the key but the SDK requires one
+            self.api_key = "local"
         self.model = model or os.getenv("DEFAULT_MODEL", "openai/gpt-3.5-turbo")
-        self.client = instructor.from_openai(
-            OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=self.api_key,
-                default_headers={
-                    "HTTP-Referer": os.getenv("APP_URL", "http://localhost:8501"),
-                    "X-Title": os.getenv("APP_NAME", "Sentinel AI")
-                }
+        # Upper bound on concurrent screen_article calls made by screen_entity
+        self.max_workers = max_workers or int(os.getenv("SCREENING_MAX_WORKERS", "8"))
+        # Article text budget for one batched prompt (see screen_entity(batched=True))
+        self.batch_token_budget = batch_token_budget or int(os.getenv("SCREENING_BATCH_TOKENS", "6000"))
+        self.max_batch_size = max_batch_size
+        # Optional AssessmentCache (src/models/assessment_cache.py) shared across screenings
+        self.cache = cache
+        # Optional RiskTriage (src/models/triage.py) that keeps routine articles away from the model
+        self.triage = triage
+        # Optional NearDuplicateClusterer (src/models/dedupe.py); only one article per cluster is screened
+        self.deduper = deduper
+        # Optional AdaptiveRateLimiter (src/models/rate_limiter.py), shared by every screener that talks to the same provider
+        self.rate_limiter = rate_limiter
+        # Cascade mode: score everything with fast_model, re-screen with self.model only articles
+        # at/above escalate_severity or below escalate_confidence
+        self.fast_model = fast_model if fast_model and fast_model != self.model else None
+        self.escalate_severity = escalate_severity
+        self.escalate_confidence = escalate_confidence
+        self.prompt_version = prompt_version
+        # Optional EvidenceSelector (src/models/evidence.py): long articles are cut down to their
+        # most relevant sentences before they are sent to the model
+        self.evidence_selector = evidence_selector
+        # Prompt-cache accounting from the provider's usage fields, cumulative for this screener
+        self.usage = {"calls": 0, "prompt_tokens": 0, "cached_prompt_tokens": 0, "completion_tokens": 0}
+        self._usage_lock = threading.Lock()
+        # Per-call timings/tokens/cost, summarized into each screening result; telemetry_sink
+        # (e.g. telemetry.JsonlSink or InMemorySink) also receives every event
+        self.telemetry = Telemetry(sink=telemetry_sink)
+        # Clients come from the process-wide registry so connection pools are reused across screeners
+        self.client = get_client(self.model, **self._client_kwargs())
+
+    def _client_kwargs(self) -> Dict:
+        kwargs = {
+            "base_url": self.base_url,
+            "api_key": self.api_key,
+            "default_headers": {
+                "HTTP-Referer": os.getenv("APP_URL", "http://localhost:8501"),
+                "X-Title": os.getenv("APP_NAME", "Sentinel AI")
+            }
+        }
+        if self.rate_limiter is not None:
+            # The limiter owns retries; stop the SDK from retrying underneath it
+            kwargs["max_retries"] = 0
+        return kwargs
+
+    def _create(self, response_model, messages: List[Dict], max_tokens: int, articles: int = 1, model: str = None):
+        """Structured-output call, scheduled through the rate limiter when one is configured."""
+        model = model or self.model
+        client = self._client_for(model)
+        reask = self._reask_policy(Retrying)
+        state = {"started": time.perf_counter(), "attempts": 0, "first_attempt": None}
+
+        def call():
+            self._note_attempt(state)
+            return client.chat.completions.create_with_completion(
+                model=model,
+                response_model=response_model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.35,
+                max_retries=reask
+            )
+        try:
+            if self.rate_limiter is None:
+                result, completion = call()
+            else:
+                result, completion = self.rate_limiter.call(call, self._estimate_tokens(messages, articles))
+        except Exception as e:
+            self._record_call(model, response_model, articles, state, reask, error=e)
+            raise
+        self._record_usage(completion)
+        self._record_call(model, response_model, articles, state, reask, completion=completion)
+        return result
+
+    async def _acreate(self, response_model, messages: List[Dict], max_tokens: int, articles: int = 1, model: str = None):
+        model = model or self.model
+        client = self._aclient_for(model)
+        reask = self._reask_policy(AsyncRetrying)
+        state = {"started": time.perf_counter(), "attempts": 0, "first_attempt": None}
+
+        def call():
+            self._note_attempt(state)
+            return client.chat.completions.create_with_completion(
+                model=model,
+                response_model=response_model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=0.35,
+                max_retries=reask
             )
+        try:
+            if self.rate_limiter is None:
+                result, completion = await call()
+            else:
+                result, completion = await self.rate_limiter.acall(call, self._estimate_tokens(messages, articles))
+        except Exception as e:
+            self._record_call(model, response_model, articles, state, reask, error=e)
+            raise
+        self._record_usage(completion)
+        self._record_call(model, response_model, articles, state, reask, completion=completion)
+        return result
+
+    def _reask_policy(self, retrying_cls):
+        """
+        instructor retries on any exception, which would resend 429/5xx responses immediately;
+        with a rate limiter, only bad model output is re-asked and the limiter owns the rest.
+        Always an explicit Retrying so telemetry can read the attempt count afterwards.
+        """
+        if self.rate_limiter is None:
+            return retrying_cls(stop=stop_after_attempt(REASK_ATTEMPTS), reraise=True)
+        return retrying_cls(
+            stop=stop_after_attempt(REASK_ATTEMPTS),
+            retry=retry_if_exception(lambda e: classify_error(e) == PERMANENT),
+            reraise=True
         )
 
-    def screen_article(self, article_text: str, entity_name: str) -> RiskAssessment:
-        prompt = f"""
-You are a professional banking compliance analyst. Score the entity in 7 risk categories based on the ARTICLE below.
-Routine news gets scores in the 11-29 range—use natural, slightly different values per category. If weak signals or indirect relevance is present, use 30-40. Moderate/strong/critical risk follows guidance below.
-Never use identical values across all categories unless literally equally relevant. Mimic human judgment: for routine news, mix values (e.g., 13, 19, 23, 16, etc.).
-
-Only give higher scores where Article gives clear evidence. Summarize reasons and cite supporting sentences.
-
-ENTITY: {entity_name}
-
-ARTICLE:
-{article_text}
-
-SCORING GUIDELINES:
-- 11–29: Routine, neutral coverage (minor lawsuits, regular ops, no flagged events)
-- 30–40: Weak signals, one-off or indirect mentions (e.g., mention of compliance efforts)
-- 41–60: Moderate risk (pending lawsuits with media coverage, warnings, non-criminal fines)
-- 61–80: Strong evidence (major fines, criminal charges, ongoing regulatory actions)
-- 81–100: Major proven event (criminal conviction/fines, bankruptcy, systemic fraud)
-
-JSON STRUCTURE:
-{{
-  "fraud": (int, 0–100),
-  "sanctions": (int, 0–100),
-  "money_laundering": (int, 0–100),
-  "bribery_corruption": (int, 0–100),
-  "cyber_incident": (int, 0–100),
-  "insolvency": (int, 0–100),
-  "esg_violation": (int, 0–100),
-  "primary_risk": "string",
-  "overall_severity": (int, 0–100),
-  "confidence": (int, 0–100),
-  "key_sentences": [{{"sentence": "...", "importance_score": float}}],
-  "explanation": "brief explanation, cite article details"
-}}
-Never include two identical scores for all categories by default. For routine news, randomize or differentiate the scores appropriately.
-"""
+    def _note_attempt(self, state: Dict):
+        state["attempts"] += 1
+        if state["first_attempt"] is None:
+            state["first_attempt"] = time.perf_counter()
+
+    def _record_call(self, model: str, response_model, articles: int, state: Dict, reask, completion=None, error: Exception = None):
+        # attempt_number counts instructor attempts within the last HTTP attempt
+        reasks = max(0, reask.statistics.get("attempt_number", 1) - 1)
+        error_kind = None
+        if error is not None:
+            error_kind = error.kind if isinstance(error, RetriesExhausted) else classify_error(error)
+        self.telemetry.record_call(
+            model, "batch" if response_model is BatchRiskAssessment else "article", articles,
+            state["started"], state["first_attempt"], state["attempts"], reasks,
+            completion=completion, error=error, error_kind=error_kind
+        )
+
+    def _record_usage(self, completion):
+        usage = getattr(completion, "usage", None)
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or 0
+        with self._usage_lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += usage.prompt_tokens or 0
+            self.usage["cached_prompt_tokens"] += cached
+            self.usage["completion_tokens"] += usage.completion_tokens or 0
+
+    def _usage_delta(self, before: Dict) -> Dict:
+        after = self.usage_stats()
+        delta = {key: after[key] - before[key] for key in ("calls", "prompt_tokens", "cached_prompt_tokens", "uncached_prompt_tokens", "completion_tokens")}
+        delta["prompt_version"] = self.prompt_version
+        delta["cached_ratio"] = round(delta["cached_prompt_tokens"] / delta["prompt_tokens"], 4) if delta["prompt_tokens"] else 0.0
+        return delta
+
+    def usage_stats(self) -> Dict:
+        """Cumulative token usage with the share of prompt tokens served from the provider's prompt cache."""
+        with self._usage_lock:
+            usage = dict(self.usage)
+        usage["uncached_prompt_tokens"] = usage["prompt_tokens"] - usage["cached_prompt_tokens"]
+        usage["cached_ratio"] = round(usage["cached_prompt_tokens"] / usage["prompt_tokens"], 4) if usage["prompt_tokens"] else 0.0
+        return usage
+
+    def _estimate_tokens(self, messages: List[Dict], articles: int) -> int:
+        prompt_chars = sum(len(message_text(message)) for message in messages)
+        return prompt_chars // CHARS_PER_TOKEN + COMPLETION_TOKENS_PER_ARTICLE * articles
+
+    @property
+    def aclient(self):
+        """Shared async client for the running event loop."""
+        return get_async_client(self.model, **self._client_kwargs())
+
+    def _client_for(self, model: str):
+        if model == self.model:
+            return self.client
+        return get_client(model, **self._client_kwargs())
+
+    def _aclient_for(self, model: str):
+        if model == self.model:
+            return self.aclient
+        return get_async_client(model, **self._client_kwargs())
+
+    def _build_messages(self, article_text: str, entity_name: str) -> List[Dict]:
+        return build_messages("article", entity_name, self._evidence_text(article_text, entity_name), self.prompt_version)
+
+    def _build_batch_messages(self, article_texts: List[str], entity_name: str) -> List[Dict]:
+        numbered = "\n\n".join(f"[{i}]\n{self._evidence_text(text, entity_name)}" for i, text in enumerate(article_texts))
+        return build_messages("batch", entity_name, numbered, self.prompt_version)
+
+    def _evidence_text(self, article_text: str, entity_name: str) -> str:
+        if self.evidence_selector is None:
+            return article_text
+        return self.evidence_selector.select(article_text, entity_name).text
+
+    def screen_article(self, article_text: str, entity_name: str, model: str = None) -> RiskAssessment:
         try:
-            assessment = self.client.chat.completions.create(
-                model=self.model,
-                response_model=RiskAssessment,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a professional, realistic banking compliance analyst. Avoid flat or identical category scores except with explicit evidence."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=2000,
-                temperature=0.35
-            )
-            assessment_dict = assessment.model_dump()
-            assessment_dict = self._apply_realistic_variance(assessment_dict)
-            return RiskAssessment(**assessment_dict)
+            assessment = self._create(RiskAssessment, self._build_messages(article_text, entity_name), max_tokens=2000, model=model)
+            return self._finalize_assessment(assessment, article_text, entity_name)
         except Exception as e:
             print(f"❌ Error: {e}")
-            return self._fallback_assessment(article_text, entity_name, str(e))
+            return self._fallback_assessment(article_text, entity_name, str(e), rate_limited=self._is_rate_limited(e))
+
+    async def ascreen_article(self, article_text: str, entity_name: str, model: str = None) -> RiskAssessment:
+        """Async counterpart of screen_article using the AsyncOpenAI client."""
+        try:
+            assessment = await self._acreate(RiskAssessment, self._build_messages(article_text, entity_name), max_tokens=2000, model=model)
+            return self._finalize_assessment(assessment, article_text, entity_name)
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            return self._fallback_assessment(article_text, entity_name, str(e), rate_limited=self._is_rate_limited(e))
+
+    def _is_rate_limited(self, error: Exception) -> bool:
+        return isinstance(error, RetriesExhausted) and error.kind == RATE_LIMIT
+
+    def screen_articles_batch(self, article_texts: List[str], entity_name: str, model: str = None) -> List[RiskAssessment]:
+        """
+        Screen several articles with one structured-output call
+        - Results are matched back to articles by article_index
+        - Articles missing from the response or failing validation fall back to screen_article,
+          as does every article when the whole response fails to parse or validate
+        - When the call fails for rate-limit or transient reasons the articles get fallback
+          assessments instead, so one throttled call does not turn into N more
+        """
+        if len(article_texts) == 1:
+            return [self.screen_article(article_texts[0], entity_name, model=model)]
+        by_index = {}
+        try:
+            batch = self._create(
+                BatchRiskAssessment,
+                self._build_batch_messages(article_texts, entity_name),
+                max_tokens=min(COMPLETION_TOKENS_PER_ARTICLE * len(article_texts), 8000),
+                articles=len(article_texts),
+                model=model
+            )
+            by_index = self._match_batch(batch, article_texts, entity_name)
+        except Exception as e:
+            kind = self._batch_failed(e, article_texts, model)
+            if kind != PERMANENT:
+                return self._batch_fallback(e, kind, article_texts, entity_name)
+        return [
+            by_index[i] if i in by_index else self.screen_article(text, entity_name, model=model)
+            for i, text in enumerate(article_texts)
+        ]
+
+    async def ascreen_articles_batch(self, article_texts: List[str], entity_name: str, model: str = None) -> List[RiskAssessment]:
+        """Async counterpart of screen_articles_batch; missing articles are re-screened concurrently."""
+        if len(article_texts) == 1:
+            return [await self.ascreen_article(article_texts[0], entity_name, model=model)]
+        by_index = {}
+        try:
+            batch = await self._acreate(
+                BatchRiskAssessment,
+                self._build_batch_messages(article_texts, entity_name),
+                max_tokens=min(COMPLETION_TOKENS_PER_ARTICLE * len(article_texts), 8000),
+                articles=len(article_texts),
+                model=model
+            )
+            by_index = self._match_batch(batch, article_texts, entity_name)
+        except Exception as e:
+            kind = self._batch_failed(e, article_texts, model)
+            if kind != PERMANENT:
+                return self._batch_fallback(e, kind, article_texts, entity_name)
+        missing = [i for i in range(len(article_texts)) if i not in by_index]
+        retried = await asyncio.gather(*(self.ascreen_article(article_texts[i], entity_name, model=model) for i in missing))
+        by_index.update(zip(missing, retried))
+        return [by_index[i] for i in range(len(article_texts))]
+
+    def _batch_failed(self, error: Exception, article_texts: List[str], model: str = None) -> str:
+        """Classify a failed batch call and report it to the telemetry sink; returns the error kind."""
+        kind = error.kind if isinstance(error, RetriesExhausted) else classify_error(error)
+        self.telemetry.emit({
+            "event": "batch_failure",
+            "timestamp": time.time(),
+            "model": model or self.model,
+            "articles": len(article_texts),
+            "error_kind": kind,
+            "action": "per_article" if kind == PERMANENT else "fallback",
+            "error": str(error)[:200]
+        })
+        return kind
+
+    def _batch_fallback(self, error: Exception, kind: str, article_texts: List[str], entity_name: str) -> List[RiskAssessment]:
+        return [self._fallback_assessment(text, entity_name, str(error), rate_limited=kind == RATE_LIMIT) for text in article_texts]
+
+    def _match_batch(self, batch: BatchRiskAssessment, article_texts: List[str], entity_name: str) -> Dict[int, RiskAssessment]:
+        """Finalized assessments from a batch response keyed by article_index; first answer per index wins."""
+        by_index = {}
+        for item in batch.assessments:
+            if item.article_index < len(article_texts) and item.article_index not in by_index:
+                by_index[item.article_index] = self._finalize_assessment(
+                    RiskAssessment(**item.model_dump(exclude={"article_index"})),
+                    article_texts[item.article_index],
+                    entity_name
+                )
+        return by_index
+
+    def _plan_batches(self, articles: List[Dict]) -> List[List[int]]:
+        """Greedily pack article indices into batches that fit the token budget."""
+        batches, current, current_tokens = [], [], 0
+        for i, article in enumerate(articles):
+            tokens = len(self._article_text(article)) // CHARS_PER_TOKEN + 1
+            if self.evidence_selector is not None:
+                tokens = min(tokens, self.evidence_selector.token_budget)
+            if current and (current_tokens + tokens > self.batch_token_budget or len(current) >= self.max_batch_size):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
 
-    def _apply_realistic_variance(self, assessment):
+    def _finalize_assessment(self, assessment: RiskAssessment, article_text: str, entity_name: str) -> RiskAssessment:
+        assessment_dict = assessment.model_dump()
+        assessment_dict = self._apply_realistic_variance(assessment_dict, self._jitter_rng(article_text, entity_name))
+        return RiskAssessment(**assessment_dict)
+
+    def _jitter_rng(self, article_text: str, entity_name: str) -> random.Random:
+        """Random source seeded from the content, so the same article always gets the same jitter."""
+        digest = hashlib.blake2b(f"{entity_name.strip().lower()}\x1f{article_text}".encode("utf-8"), digest_size=8).digest()
+        return random.Random(int.from_bytes(digest, "big"))
+
+    def _apply_realistic_variance(self, assessment, rng: random.Random):
         """For routine/low scores add natural-looking noise, avoid flat scores."""
         risk_fields = ['fraud', 'sanctions', 'money_laundering', 'bribery_corruption', 'cyber_incident', 'insolvency', 'esg_violation']
         values = [assessment.get(cat, 0) for cat in risk_fields]
-        # If all scores between 11-29 AND less than 3 unique, randomize
+        # If all scores between 11-29 AND less than 3 unique, spread them (content-seeded, repeatable)
         low_vals = all(11 <= v <= 29 for v in values)
         unique_cnt = len(set(values))
         if low_vals and unique_cnt < 3:
             base = 15
             for i, cat in enumerate(risk_fields):
-                assessment[cat] = base + random.randint(-4, 12) + i
+                assessment[cat] = base + rng.randint(-4, 12) + i
         # If scores are identical but above low range (likely fallback), randomize those too
         if unique_cnt <= 1:
             for i, cat in enumerate(risk_fields):
-                assessment[cat] = 14 + random.randint(0, 14) + (i % 4)
+                assessment[cat] = 14 + rng.randint(0, 14) + (i % 4)
         # Always set overall_severity and primary_risk correctly
         new_scores = [assessment.get(cat, 0) for cat in risk_fields]
         assessment['overall_severity'] = max(new_scores)
         assessment['primary_risk'] = risk_fields[new_scores.index(max(new_scores))]
         return assessment
 
-    def _fallback_assessment(self, article_text, entity_name, error_message):
+    def _fallback_assessment(self, article_text, entity_name, error_message, rate_limited=False):
         cats = ['fraud', 'sanctions', 'money_laundering', 'bribery_corruption', 'cyber_incident', 'insolvency', 'esg_violation']
-        fallback_scores = {cat: 15 + random.randint(0, 12) for cat in cats}
+        rng = self._jitter_rng(article_text, entity_name)
+        fallback_scores = {cat: 15 + rng.randint(0, 12) for cat in cats}
         primary = max(fallback_scores, key=fallback_scores.get)
         return RiskAssessment(
             **fallback_scores,
@@ -137,38 +451,479 @@ Never include two identical scores for all categories by default. For routine ne
             overall_severity=max(fallback_scores.values()),
             confidence=40,
             key_sentences=[],
-            explanation=f"Fallback: Unable to screen article due to error. Error: {error_message[:75]}"
+            explanation=(
+                f"{RATE_LIMITED_PREFIX}; retries exhausted, article not screened. Error: {error_message[:75]}"
+                if rate_limited else
+                f"{FALLBACK_PREFIX} Unable to screen article due to error. Error: {error_message[:75]}"
+            )
         )
 
-    def screen_entity(self, articles: List[Dict], entity_name: str) -> Dict:
+    def screen_entity(self, articles: List[Dict], entity_name: str, max_workers: int = None, batched: bool = False, early_stop: bool = False) -> Dict:
+        """
+        Screen all articles for an entity and aggregate the results
+        - early_stop=True screens in priority order (strongest triage signal, then newest) and
+          stops once category scores have stabilized and nothing crossed the high-risk threshold
+        """
+        if not articles:
+            return self._empty_result(entity_name)
+        for event in self._screen_events(articles, entity_name, max_workers, batched, partials=False, early_stop=early_stop):
+            pass
+        return event["result"]
+
+    def iter_screen_entity(self, articles: List[Dict], entity_name: str, max_workers: int = None, batched: bool = False, early_stop: bool = False) -> Iterator[Dict]:
+        """
+        Streaming variant of screen_entity
+        - Yields an "assessment" event per article as soon as it is ready (completion order),
+          with a running "partial" aggregate over the articles finished so far
+        - Ends with a "complete" event whose "result" equals what screen_entity returns
+        - Closing the generator early cancels model calls that have not started yet
+        """
         if not articles:
-            return {
-                "entity_name": entity_name,
-                "screening_date": datetime.now().isoformat(),
-                "articles_analyzed": 0,
-                "overall_severity": 0,
-                "error": "No articles found"
+            yield {"event": "complete", "completed": 0, "total": 0, "result": self._empty_result(entity_name)}
+            return
+        yield from self._screen_events(articles, entity_name, max_workers, batched, partials=True, early_stop=early_stop)
+
+    def _screen_events(self, articles: List[Dict], entity_name: str, max_workers: int, batched: bool, partials: bool, early_stop: bool = False) -> Iterator[Dict]:
+        representatives, members = self._plan_clusters(articles, early_stop)
+        records = [None] * len(articles)
+        finished = []
+        completed = 0
+        stage_stats = {}
+        stop_reason = None
+        # Aggregated scores after each model-scored article, for the early-stop test
+        score_history = []
+        usage_before = self.usage_stats()
+        telemetry_mark = self.telemetry.mark()
+        started = time.perf_counter()
+        # LLM-backed assessments (fresh or cached); triaged-out articles are already decided and cost nothing
+        scored = []
+        with closing(self._iter_stages([articles[i] for i in representatives], entity_name, max_workers, batched, stage_stats)) as stages:
+            for local_index, record, stage in stages:
+                cluster_id = representatives[local_index]
+                finished.append(record)
+                if stage != "triage":
+                    scored.append(record)
+                partial = self._aggregate_assessments(finished, entity_name) if partials else None
+                for i, member_record in self._member_records(record, articles, members[cluster_id], cluster_id):
+                    records[i] = member_record
+                    completed += 1
+                    yield {
+                        "event": "assessment",
+                        "index": i,
+                        "assessment": records[i],
+                        "completed": completed,
+                        "total": len(articles),
+                        "partial": partial
+                    }
+                if early_stop and stage != "triage":
+                    aggregate = self._aggregate_assessments(finished, entity_name)
+                    score_history.append({**aggregate["risk_scores"], "overall_severity": aggregate["overall_severity"]})
+                    stop_reason = self._early_stop_reason(scored, score_history)
+                    if stop_reason:
+                        break
+        result = self._entity_result(records, representatives, entity_name, usage_before, telemetry_mark, started, stage_stats)
+        if early_stop:
+            if stop_reason is None:
+                high_risk = any(r.get('overall_severity', 0) > HIGH_RISK_THRESHOLD for r in finished)
+                if high_risk:
+                    stop_reason = "high-risk article found; screened everything"
+                elif len(scored) < EARLY_STOP_MIN_ARTICLES:
+                    # Stability is only evaluated from EARLY_STOP_MIN_ARTICLES model-scored articles on
+                    stop_reason = f"fewer than {EARLY_STOP_MIN_ARTICLES} model-scored articles ({len(scored)}); screened everything"
+                else:
+                    stop_reason = "scores did not stabilize; screened everything"
+            result["early_stop"] = {
+                "stopped": completed < len(articles),
+                "articles_skipped": len(articles) - completed,
+                "reason": stop_reason
             }
-        assessments = []
-        for article in articles:
-            article_text = f"{article.get('title', '')}\n\n{article.get('content', '')}"
-            assessment = self.screen_article(article_text, entity_name)
-            assessment_dict = assessment.model_dump()
-            assessment_dict.update({
-                'article_url': article.get('url', ''),
-                'article_title': article.get('title', ''),
-                'publish_date': article.get('publish_date', ''),
-                'source': article.get('source', '')
+        yield {"event": "complete", "completed": completed, "total": len(articles), "result": result}
+
+    def _plan_clusters(self, articles: List[Dict], early_stop: bool = False) -> Tuple[List[int], Dict[int, List[int]]]:
+        """
+        (representative indices to screen, cluster id -> member indices); without a deduper every
+        article is its own cluster. early_stop orders representatives by screening priority.
+        """
+        if self.deduper is not None:
+            cluster_ids = self.deduper.cluster(articles)
+        else:
+            cluster_ids = list(range(len(articles)))
+        representatives = sorted(set(cluster_ids))
+        if early_stop:
+            rank = {i: position for position, i in enumerate(self._priority_order(articles))}
+            representatives.sort(key=rank.get)
+        members = {}
+        for i, cluster_id in enumerate(cluster_ids):
+            members.setdefault(cluster_id, []).append(i)
+        return representatives, members
+
+    def _member_records(self, record: Dict, articles: List[Dict], members: List[int], cluster_id: int) -> Iterator[Tuple[int, Dict]]:
+        """(index, record) for every article of a cluster, copying the representative's assessment."""
+        for i in members:
+            if self.deduper is not None:
+                yield i, self._cluster_member_record(record, articles[i], i, cluster_id)
+            else:
+                yield i, record
+
+    def _entity_result(self, records: List[Dict], representatives: List[int], entity_name: str, usage_before: Dict,
+                       telemetry_mark: int, started: float, stage_stats: Dict) -> Dict:
+        """Entity result from per-article records (None where not screened) plus the stage and dedupe sections."""
+        screened = sorted(i for i in representatives if records[i] is not None)
+        # Aggregate over one assessment per story so syndicated copies do not skew the scores
+        result = self._finalize_result([records[i] for i in screened], entity_name, usage_before, telemetry_mark, started, len(records))
+        result.update(stage_stats)
+        if self.deduper is not None:
+            result["all_assessments"] = [record for record in records if record is not None]
+            result["articles_analyzed"] = len(result["all_assessments"])
+            result["dedupe"] = {"clusters": len(representatives), "duplicates": len(records) - len(representatives)}
+        return result
+
+    def _finalize_result(self, assessments: List[Dict], entity_name: str, usage_before: Dict, telemetry_mark: int, started: float, articles: int) -> Dict:
+        """Aggregate plus the sections every screening result carries: failures, usage, telemetry and cascade."""
+        result = self._aggregate_assessments(assessments, entity_name)
+        fallbacks = [r for r in assessments if r.get('explanation', '').startswith(FALLBACK_PREFIX)]
+        rate_limited = sum(1 for r in fallbacks if r['explanation'].startswith(RATE_LIMITED_PREFIX))
+        result["failures"] = {"rate_limited": rate_limited, "errors": len(fallbacks) - rate_limited}
+        result["usage"] = self._usage_delta(usage_before)
+        result["telemetry"] = self._screening_telemetry(telemetry_mark, started, entity_name, articles)
+        if self.fast_model is not None:
+            tiers = [r.get('model_tier') for r in assessments]
+            result["cascade"] = {
+                "fast_model": self.fast_model,
+                "strong_model": self.model,
+                "fast": tiers.count("fast"),
+                "escalated": tiers.count("escalated"),
+                "triage": tiers.count("triage")
+            }
+        return result
+
+    def _screening_telemetry(self, mark: int, started: float, entity_name: str, articles: int) -> Dict:
+        """Summary of the model calls made since mark; also emitted to the sink as a "screening" event."""
+        summary = Telemetry.summarize(self.telemetry.since(mark))
+        summary["screening_wall_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self.telemetry.emit({
+            "event": "screening",
+            "timestamp": time.time(),
+            "entity_name": entity_name,
+            "articles": articles,
+            **{key: value for key, value in summary.items() if key != "by_model"}
+        })
+        return summary
+
+    def _priority_order(self, articles: List[Dict]) -> List[int]:
+        """Article indices by strongest triage signal first, then newest first."""
+        if self.triage is not None:
+            signal = self.triage.signal_matrix([self._article_text(article) for article in articles]).max(axis=1).tolist()
+        else:
+            signal = [0.0] * len(articles)
+        # Undated articles sort last
+        timestamps = [publish_timestamp(article.get('publish_date', '')) or 0.0 for article in articles]
+        return sorted(range(len(articles)), key=lambda i: (-signal[i], -timestamps[i]))
+
+    def _early_stop_reason(self, scored: List[Dict], score_history: List[Dict]):
+        """
+        Return why screening can stop now, or None to keep going.
+        score_history holds the aggregated risk_scores and overall_severity (the same mean / spike
+        blend that is reported) after each model-scored article; articles arrive in priority order,
+        not at random, so this is a stability check, not a confidence interval.
+        """
+        n = len(scored)
+        if n < EARLY_STOP_MIN_ARTICLES or len(score_history) <= EARLY_STOP_WINDOW:
+            return None
+        if any(a.get('overall_severity', 0) > HIGH_RISK_THRESHOLD for a in scored):
+            return None
+        current = score_history[-1]
+        for scores in score_history[-EARLY_STOP_WINDOW - 1:-1]:
+            if any(abs(scores[field] - current[field]) > EARLY_STOP_TOLERANCE for field in current):
+                return None
+        return (
+            f"aggregated scores stayed within ±{EARLY_STOP_TOLERANCE:g} points over the last {EARLY_STOP_WINDOW} "
+            f"model-scored articles ({n} screened) and none above severity {HIGH_RISK_THRESHOLD}"
+        )
+
+    def _cluster_member_record(self, representative: Dict, article: Dict, index: int, cluster_id: int) -> Dict:
+        record = representative if index == cluster_id else {**representative, **self._article_metadata(article)}
+        record['cluster_id'] = cluster_id
+        return record
+
+    def _iter_stages(self, articles: List[Dict], entity_name: str, max_workers: int, batched: bool, stage_stats: Dict) -> Iterator[Tuple[int, Dict, str]]:
+        """
+        Yield (article index, record, stage) as each article is resolved; stage is "cache", "triage" or "model"
+        - Cache hits and triaged-out articles first, then model results as they complete
+        - Fresh model results are written to the cache and stage_stats is filled in on exit,
+          including when the consumer stops early
+        """
+        plan = self._plan_stages(articles, entity_name)
+        fresh = {}
+        try:
+            yield from plan["resolved"]
+            pending = plan["pending"]
+            with closing(self._iter_model_records([articles[i] for i in pending], entity_name, max_workers, batched)) as model_records:
+                for local_index, record in model_records:
+                    fresh[pending[local_index]] = record
+                    yield pending[local_index], record, "model"
+        finally:
+            self._close_stages(plan, fresh, len(articles), stage_stats)
+
+    async def _astage_records(self, articles: List[Dict], entity_name: str, max_concurrency: int, batched: bool, stage_stats: Dict) -> List[Dict]:
+        """Async counterpart of _iter_stages: one record per article, in article order."""
+        plan = self._plan_stages(articles, entity_name)
+        records = [None] * len(articles)
+        for i, record, _ in plan["resolved"]:
+            records[i] = record
+        pending = plan["pending"]
+        fresh = {}
+        try:
+            model_records = await self._amodel_records([articles[i] for i in pending], entity_name, max_concurrency, batched)
+            fresh = {pending[local_index]: record for local_index, record in enumerate(model_records)}
+            for i, record in fresh.items():
+                records[i] = record
+        finally:
+            self._close_stages(plan, fresh, len(articles), stage_stats)
+        return records
+
+    def _plan_stages(self, articles: List[Dict], entity_name: str) -> Dict:
+        """
+        Resolve what can be decided without the model: cache hits, then triage over the misses.
+        Returns cache_keys, resolved [(index, record, stage)], pending (indices left for the model),
+        cache_hits and triaged_out.
+        """
+        cache_keys = []
+        pending = list(range(len(articles)))
+        resolved = []
+        if self.cache is not None:
+            cache_keys = [
+                self.cache.make_key(self._article_text(article), entity_name, self._cache_model_id(), self.prompt_version)
+                for article in articles
+            ]
+            cached = self.cache.get_many(cache_keys)
+            resolved = [(i, self._cached_record(cached[key], articles[i]), "cache") for i, key in enumerate(cache_keys) if key in cached]
+            pending = [i for i, key in enumerate(cache_keys) if key not in cached]
+        cache_hits = len(resolved)
+        triaged_out = []
+        if self.triage is not None and pending:
+            candidates, routine = self.triage.split([self._article_text(articles[i]) for i in pending])
+            triaged_out = [pending[j] for j in routine]
+            resolved += [
+                (i, self._routine_record(articles[i], entity_name), "triage")
+                for i in triaged_out
+            ]
+            pending = [pending[j] for j in candidates]
+        return {"cache_keys": cache_keys, "resolved": resolved, "pending": pending, "cache_hits": cache_hits, "triaged_out": triaged_out}
+
+    def _close_stages(self, plan: Dict, fresh: Dict[int, Dict], articles: int, stage_stats: Dict):
+        """Write fresh model results (not fallbacks) to the cache and fill in stage_stats."""
+        if self.cache is not None:
+            cache_keys = plan["cache_keys"]
+            self.cache.put_many({
+                cache_keys[i]: {field: record[field] for field in [*RiskAssessment.model_fields, 'model', 'model_tier']}
+                for i, record in fresh.items()
+                if not record.get('explanation', '').startswith(FALLBACK_PREFIX)
             })
-            assessments.append(assessment_dict)
-        return self._aggregate_assessments(assessments, entity_name)
+            stage_stats["cache"] = {"hits": plan["cache_hits"], "misses": articles - plan["cache_hits"]}
+        if self.triage is not None:
+            stage_stats["triage"] = {
+                "threshold": self.triage.threshold,
+                "triaged_out": len(plan["triaged_out"]),
+                "candidates": len(plan["pending"])
+            }
+
+    def _routine_record(self, article: Dict, entity_name: str) -> Dict:
+        """Assessment for a triaged-out article; scores are jittered from its content, like the model path."""
+        rng = self._jitter_rng(self._article_text(article), entity_name)
+        return self._assessment_record(RiskAssessment(**self.triage.routine_assessment(rng)), article, model=None, tier="triage")
+
+    def _iter_model_records(self, articles: List[Dict], entity_name: str, max_workers: int = None, batched: bool = False) -> Iterator[Tuple[int, Dict]]:
+        """Send articles to the model (one call each, or packed into batches) and yield (index, record) as they complete."""
+        if not articles:
+            return
+        units = self._plan_batches(articles) if batched else [[i] for i in range(len(articles))]
+
+        def screen_unit(unit: List[int]) -> List[Dict]:
+            if batched:
+                return self._screen_batch_records([articles[i] for i in unit], entity_name)
+            return [self._screen_article_record(articles[unit[0]], entity_name)]
+
+        workers = max(1, min(max_workers or self.max_workers, len(units)))
+        if workers == 1:
+            for unit in units:
+                yield from zip(unit, screen_unit(unit))
+            return
+        pool = ThreadPoolExecutor(max_workers=workers)
+        queued = iter(units)
+        futures = {}
+        try:
+            # Keep only a small window submitted so a consumer that stops early wastes little work
+            for unit in itertools.islice(queued, 2 * workers):
+                futures[pool.submit(screen_unit, unit)] = unit
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    unit = futures.pop(future)
+                    for next_unit in itertools.islice(queued, 1):
+                        futures[pool.submit(screen_unit, next_unit)] = next_unit
+                    yield from zip(unit, future.result())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def ascreen_entity(self, articles: List[Dict], entity_name: str, max_concurrency: int = None, batched: bool = False) -> Dict:
+        """
+        Async counterpart of screen_entity, with the same cache, triage, dedupe, batching and cascade stages
+        - At most max_concurrency model calls (articles or batches) are in flight at once
+        - Cancelling the caller cancels every outstanding model call
+        - Early stopping is not supported here; use screen_entity(early_stop=True)
+        """
+        if not articles:
+            return self._empty_result(entity_name)
+        representatives, members = self._plan_clusters(articles)
+        stage_stats = {}
+        usage_before = self.usage_stats()
+        telemetry_mark = self.telemetry.mark()
+        started = time.perf_counter()
+        screened = await self._astage_records([articles[i] for i in representatives], entity_name, max_concurrency, batched, stage_stats)
+        records = [None] * len(articles)
+        for cluster_id, record in zip(representatives, screened):
+            for i, member_record in self._member_records(record, articles, members[cluster_id], cluster_id):
+                records[i] = member_record
+        return self._entity_result(records, representatives, entity_name, usage_before, telemetry_mark, started, stage_stats)
+
+    async def _amodel_records(self, articles: List[Dict], entity_name: str, max_concurrency: int = None, batched: bool = False) -> List[Dict]:
+        """Async counterpart of _iter_model_records; returns the records in article order."""
+        if not articles:
+            return []
+        units = self._plan_batches(articles) if batched else [[i] for i in range(len(articles))]
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_workers))
+
+        async def screen_unit(unit: List[int]) -> List[Dict]:
+            if batched:
+                # Takes a slot for the batch call and one per escalation, so cascades stay within the limit
+                return await self._ascreen_batch_records([articles[i] for i in unit], entity_name, semaphore)
+            async with semaphore:
+                return [await self._ascreen_article_record(articles[unit[0]], entity_name)]
+
+        tasks = [asyncio.ensure_future(screen_unit(unit)) for unit in units]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        records = [None] * len(articles)
+        for unit, unit_records in zip(units, results):
+            for i, record in zip(unit, unit_records):
+                records[i] = record
+        return records
+
+    def _empty_result(self, entity_name: str) -> Dict:
+        return {
+            "entity_name": entity_name,
+            "screening_date": datetime.now().isoformat(),
+            "articles_analyzed": 0,
+            "overall_severity": 0,
+            "error": "No articles found"
+        }
+
+    def _article_text(self, article: Dict) -> str:
+        # Normalized RSS items often have no content beyond the headline
+        return "\n\n".join(part for part in (article.get('title', ''), article.get('content', '')) if part)
+
+    def _screen_article_record(self, article: Dict, entity_name: str) -> Dict:
+        """Screen one fetched article and attach its metadata to the assessment dict."""
+        text = self._article_text(article)
+        if self.fast_model is None:
+            return self._assessment_record(self.screen_article(text, entity_name), article, self.model, "primary")
+        return self._cascade_record(self.screen_article(text, entity_name, model=self.fast_model), text, article, entity_name)
+
+    def _screen_batch_records(self, batch: List[Dict], entity_name: str) -> List[Dict]:
+        texts = [self._article_text(article) for article in batch]
+        if self.fast_model is None:
+            assessments = self.screen_articles_batch(texts, entity_name)
+            return [self._assessment_record(assessment, article, self.model, "primary") for assessment, article in zip(assessments, batch)]
+        assessments = self.screen_articles_batch(texts, entity_name, model=self.fast_model)
+        return [
+            self._cascade_record(assessment, text, article, entity_name)
+            for assessment, text, article in zip(assessments, texts, batch)
+        ]
+
+    async def _ascreen_article_record(self, article: Dict, entity_name: str) -> Dict:
+        text = self._article_text(article)
+        if self.fast_model is None:
+            return self._assessment_record(await self.ascreen_article(text, entity_name), article, self.model, "primary")
+        return await self._acascade_record(await self.ascreen_article(text, entity_name, model=self.fast_model), text, article, entity_name)
+
+    async def _ascreen_batch_records(self, batch: List[Dict], entity_name: str, semaphore: asyncio.Semaphore = None) -> List[Dict]:
+        """semaphore, when given, is held for each model call (the batch call, then every escalation) rather than the whole batch."""
+        texts = [self._article_text(article) for article in batch]
+        async with semaphore or nullcontext():
+            if self.fast_model is None:
+                assessments = await self.ascreen_articles_batch(texts, entity_name)
+                return [self._assessment_record(assessment, article, self.model, "primary") for assessment, article in zip(assessments, batch)]
+            assessments = await self.ascreen_articles_batch(texts, entity_name, model=self.fast_model)
+        return list(await asyncio.gather(*(
+            self._acascade_record(assessment, text, article, entity_name, semaphore)
+            for assessment, text, article in zip(assessments, texts, batch)
+        )))
+
+    async def _acascade_record(self, fast_assessment: RiskAssessment, text: str, article: Dict, entity_name: str,
+                               semaphore: asyncio.Semaphore = None) -> Dict:
+        if not self._needs_escalation(fast_assessment):
+            return self._assessment_record(fast_assessment, article, self.fast_model, "fast")
+        async with semaphore or nullcontext():
+            assessment = await self.ascreen_article(text, entity_name)
+        return self._assessment_record(assessment, article, self.model, "escalated")
+
+    def _cascade_record(self, fast_assessment: RiskAssessment, text: str, article: Dict, entity_name: str) -> Dict:
+        """Keep the fast model's assessment unless it looks risky or unsure; then ask the strong model."""
+        if not self._needs_escalation(fast_assessment):
+            return self._assessment_record(fast_assessment, article, self.fast_model, "fast")
+        return self._assessment_record(self.screen_article(text, entity_name), article, self.model, "escalated")
+
+    def _needs_escalation(self, assessment: RiskAssessment) -> bool:
+        return assessment.overall_severity >= self.escalate_severity or assessment.confidence < self.escalate_confidence
+
+    def _cache_model_id(self) -> str:
+        model_id = self.model
+        if self.fast_model is not None:
+            model_id = f"{self.fast_model}>{self.model}@{self.escalate_severity}/{self.escalate_confidence}"
+        if self.evidence_selector is not None:
+            # The model saw a reduced article, so its answers are not interchangeable with full-text ones
+            model_id = f"{model_id}+{self.evidence_selector.cache_tag()}"
+        return model_id
+
+    def _assessment_record(self, assessment: RiskAssessment, article: Dict, model: str = None, tier: str = "primary") -> Dict:
+        assessment_dict = assessment.model_dump()
+        assessment_dict.update(self._article_metadata(article))
+        assessment_dict.update({'model': model, 'model_tier': tier})
+        if self.evidence_selector is not None:
+            # [start, end] of each key sentence in the article text (title + content), None if not found
+            text = self._article_text(article)
+            assessment_dict['evidence_spans'] = [
+                list(span) if span else None
+                for span in (EvidenceSelector.locate(text, s['sentence']) for s in assessment_dict['key_sentences'])
+            ]
+        return assessment_dict
+
+    def _cached_record(self, payload: Dict, article: Dict) -> Dict:
+        assessment = RiskAssessment(**{field: payload[field] for field in RiskAssessment.model_fields})
+        return self._assessment_record(assessment, article, payload.get('model', self.model), payload.get('model_tier', "primary"))
+
+    def _article_metadata(self, article: Dict) -> Dict:
+        return {
+            'article_url': article.get('url', ''),
+            'article_title': article.get('title', ''),
+            'publish_date': article.get('publish_date', ''),
+            'source': article.get('source', '')
+        }
 
     def _aggregate_assessments(self, assessments: List[Dict], entity_name: str) -> Dict:
         risk_categories = ['fraud', 'sanctions', 'money_laundering', 'bribery_corruption', 'cyber_incident', 'insolvency', 'esg_violation']
+        # Fallback records were never screened; their placeholder scores are not evidence either way
+        screened = [a for a in assessments if not a.get('explanation', '').startswith(FALLBACK_PREFIX)]
         # Use mean for routine categories, spike highlight if one article is much higher
         aggregated_scores = {}
         for category in risk_categories:
-            scores = [a.get(category, 0) for a in assessments if a.get(category, 0) > 0]
+            scores = [a.get(category, 0) for a in screened if a.get(category, 0) > 0]
             if not scores:
                 aggregated_scores[category] = 0
             elif max(scores) - min(scores) > 20:
@@ -176,9 +931,12 @@ Never include two identical scores for all categories by default. For routine ne
             else:
                 aggregated_scores[category] = sum(scores) // len(scores)
         overall_severity = max(aggregated_scores.values())
-        high_risk_articles = [a for a in assessments if a.get('overall_severity', 0) > 50]
+        high_risk_articles = [a for a in screened if a.get('overall_severity', 0) > 50]
         high_risk_articles = sorted(high_risk_articles, key=lambda x: x.get('overall_severity', 0), reverse=True)
         primary_risk = max(aggregated_scores, key=aggregated_scores.get)
+        if assessments and all(a.get('model_tier') == "triage" for a in screened):
+            # Routine scores are jitter (and nothing else was screened); their top category is not a finding
+            primary_risk = NO_PRIMARY_RISK
         return {
             "entity_name": entity_name,
             "screening_date": datetime.now().isoformat(),
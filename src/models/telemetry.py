@@ -0,0 +1,178 @@
+"""
+Per-call LLM telemetry for AdverseMediaScreener
+- One event per model call: wall time, rate-limiter queue wait, HTTP attempts, instructor
+  validation re-asks, prompt/cached/completion tokens, estimated cost and outcome
+- Events go to a pluggable sink (JSONL file, in-memory list) and are summarized per screening
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# USD per 1M (prompt, completion) tokens on OpenRouter; override with Telemetry(prices=...)
+MODEL_PRICES = {
+    "openai/gpt-3.5-turbo": (0.50, 1.50),
+    "openai/gpt-4o": (2.50, 10.00),
+    "openai/gpt-4o-mini": (0.15, 0.60),
+    "anthropic/claude-3-haiku": (0.25, 1.25),
+    "anthropic/claude-3.5-sonnet": (3.00, 15.00),
+}
+# Share of the prompt price charged for tokens served from the provider's prompt cache
+CACHED_PROMPT_PRICE_RATIO = 0.5
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_prompt_tokens: int = 0, prices: Dict = None) -> Optional[float]:
+    """Estimated USD cost of one call, or None when the model has no known price."""
+    price = (prices or MODEL_PRICES).get(model)
+    if price is None:
+        return None
+    prompt_price, completion_price = price
+    uncached = prompt_tokens - cached_prompt_tokens
+    cost = uncached * prompt_price + cached_prompt_tokens * prompt_price * CACHED_PROMPT_PRICE_RATIO + completion_tokens * completion_price
+    return cost / 1_000_000
+
+
+class InMemorySink:
+    """Keeps emitted events in a list (tests, notebooks, the benchmark)."""
+
+    def __init__(self):
+        self.events: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict):
+        with self._lock:
+            self.events.append(event)
+
+    def close(self):
+        pass
+
+
+class JsonlSink:
+    """Appends one JSON object per line to path."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def emit(self, event: Dict):
+        line = json.dumps(event, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class Telemetry:
+    """
+    Collects call events for one screener and forwards them to sink (anything with emit(event)).
+    The most recent max_events calls are kept for per-screening summaries.
+    """
+
+    def __init__(self, sink=None, prices: Dict = None, max_events: int = 10_000):
+        self.sink = sink
+        self.prices = prices or MODEL_PRICES
+        self._events = deque(maxlen=max_events)
+        self._emitted = 0
+        self._lock = threading.Lock()
+
+    def record_call(self, model: str, kind: str, articles: int, started: float, first_attempt: float,
+                    attempts: int, validation_retries: int, completion=None, error: Exception = None, error_kind: str = None) -> Dict:
+        """Build, keep and emit the event for one finished call; started/first_attempt are perf_counter values."""
+        usage = getattr(completion, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", None) or 0
+        completion_tokens = getattr(usage, "completion_tokens", None) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", None) or 0
+        now = time.perf_counter()
+        cost = estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens, self.prices)
+        event = {
+            "event": "llm_call",
+            "timestamp": time.time(),
+            "model": model,
+            "kind": kind,
+            "articles": articles,
+            "status": "ok" if error is None else error_kind or "error",
+            "wall_ms": round((now - started) * 1000, 1),
+            "queue_wait_ms": round(((first_attempt or now) - started) * 1000, 1),
+            "attempts": attempts,
+            "validation_retries": validation_retries,
+            "prompt_tokens": prompt_tokens,
+            "cached_prompt_tokens": cached_tokens,
+            "completion_tokens": completion_tokens,
+            "cost_usd": round(cost, 8) if cost is not None else None
+        }
+        if error is not None:
+            event["error"] = str(error)[:200]
+        with self._lock:
+            self._events.append(event)
+            self._emitted += 1
+        self.emit(event)
+        return event
+
+    def emit(self, event: Dict):
+        if self.sink is not None:
+            self.sink.emit(event)
+
+    def mark(self) -> int:
+        """Position to pass to since() to get the calls made after this point."""
+        with self._lock:
+            return self._emitted
+
+    def since(self, mark: int) -> List[Dict]:
+        with self._lock:
+            count = min(self._emitted - mark, len(self._events))
+            return list(self._events)[len(self._events) - count:] if count > 0 else []
+
+    @staticmethod
+    def summarize(events: List[Dict]) -> Dict:
+        """Aggregate call events into the telemetry section of a screening result."""
+        summary = {
+            "calls": len(events),
+            "failed_calls": sum(1 for e in events if e["status"] != "ok"),
+            "articles": sum(e["articles"] for e in events),
+            "attempts": sum(e["attempts"] for e in events),
+            "validation_retries": sum(e["validation_retries"] for e in events),
+            "prompt_tokens": sum(e["prompt_tokens"] for e in events),
+            "cached_prompt_tokens": sum(e["cached_prompt_tokens"] for e in events),
+            "completion_tokens": sum(e["completion_tokens"] for e in events),
+            "cost_usd": None,
+            "wall_ms": _distribution([e["wall_ms"] for e in events]),
+            "queue_wait_ms": _distribution([e["queue_wait_ms"] for e in events]),
+            "by_model": {}
+        }
+        costs = [e["cost_usd"] for e in events if e["cost_usd"] is not None]
+        if costs:
+            summary["cost_usd"] = round(sum(costs), 6)
+        for model in sorted({e["model"] for e in events}):
+            model_events = [e for e in events if e["model"] == model]
+            model_costs = [e["cost_usd"] for e in model_events if e["cost_usd"] is not None]
+            summary["by_model"][model] = {
+                "calls": len(model_events),
+                "prompt_tokens": sum(e["prompt_tokens"] for e in model_events),
+                "completion_tokens": sum(e["completion_tokens"] for e in model_events),
+                "cost_usd": round(sum(model_costs), 6) if model_costs else None,
+                "p50_wall_ms": _distribution([e["wall_ms"] for e in model_events])["p50"]
+            }
+        return summary
+
+
+def _distribution(values: List[float]) -> Dict:
+    if not values:
+        return {"total": 0.0, "p50": None, "p95": None, "max": None}
+    array = np.asarray(values)
+    return {
+        "total": round(float(array.sum()), 1),
+        "p50": round(float(np.percentile(array, 50)), 1),
+        "p95": round(float(np.percentile(array, 95)), 1),
+        "max": round(float(array.max()), 1)
+    }
@@ -0,0 +1,285 @@
+"""
+Embedded SQLite article store for NewsFetcher
+- Each article is stored once, keyed by its canonical URL
+- entity_articles links entities to articles, indexed by (entity, publish time)
+- entity_timeline keeps, per entity, how far back the stored articles reach (covered_since),
+  the newest publish time seen (high_water) and the last network refresh
+- Every write is one transaction; a crash never leaves half a result set
+- import_json_cache() loads the legacy data/cache files (.json or .cache) once
+
+Import the legacy cache, run with src on the path:
+    PYTHONPATH=src python -m utils.article_store data/cache --db data/articles.db
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from utils import cache_codec
+
+# Query parameters that only track the click, not the article
+_TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ocid|oc|cmpid|ref|smid|taid)$", re.IGNORECASE)
+# days_back values offered in the UI, tried when matching legacy cache keys
+_LEGACY_DAYS_BACK = (7, 14, 30, 60, 90, 180, 365)
+_TITLE_WORD_RE = re.compile(r"\b[A-Z][\w&.'-]*(?:\s+[A-Z][\w&.'-]*)?")
+_TITLE_STOPWORDS = {"The", "A", "An", "In", "On", "Of", "For", "And", "To", "How", "Why", "What", "New", "BREAKING", "Inc", "Co", "With"}
+# Google News RSS returns at most ~100 items per query; results this large are treated as truncated
+# (a little below the cap, since NewsFetcher drops stub entries after fetching)
+RSS_CAPPED_RESULTS = 90
+
+
+def canonical_url(url: str) -> str:
+    """Lower-cased scheme/host, no fragment, no tracking parameters, no trailing slash."""
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _TRACKING_PARAMS.match(k)])
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def normalize_entity(entity_name: str) -> str:
+    return " ".join(entity_name.split()).casefold()
+
+
+def publish_timestamp(value: str) -> Optional[float]:
+    """Epoch seconds of an RSS (RFC 822) or ISO 8601 date, None when unparseable."""
+    if not value:
+        return None
+    for parse in (parsedate_to_datetime, lambda v: datetime.fromisoformat(v.replace("Z", "+00:00"))):
+        try:
+            parsed = parse(value)
+        except (TypeError, ValueError, IndexError):
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+
+def feed_coverage_start(articles: List[Dict], window_start: float) -> float:
+    """
+    How far back a feed result for a window starting at window_start really reaches: the whole
+    window when the feed returned fewer items than its cap, otherwise only the oldest article returned.
+    """
+    if len(articles) < RSS_CAPPED_RESULTS:
+        return window_start
+    published = [ts for ts in (publish_timestamp(article.get("publish_date", "")) for article in articles) if ts is not None]
+    return max(window_start, min(published, default=time.time()))
+
+
+def infer_entity(articles: List[Dict]) -> str:
+    """Capitalized word (or pair) found in the most headlines; legacy cache files do not store the query."""
+    counts = Counter()
+    for article in articles:
+        title = article.get("title", "").rsplit(" - ", 1)[0]
+        counts.update({match.strip() for match in _TITLE_WORD_RE.findall(title) if match.split()[0] not in _TITLE_STOPWORDS})
+    if not counts:
+        return "Unknown"
+    best = max(counts.values())
+    # Prefer the longer name among equally frequent candidates ("JP Morgan" over "JP")
+    return max((name for name, count in counts.items() if count >= 0.8 * best), key=lambda name: (counts[name] >= best, len(name.split()), counts[name]))
+
+
+class ArticleStore:
+    def __init__(self, path: str = "data/articles.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE,
+                    published_at REAL,
+                    payload TEXT NOT NULL,
+                    first_seen REAL NOT NULL,
+                    last_seen REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entity_articles (
+                    entity TEXT NOT NULL,
+                    article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,
+                    published_at REAL,
+                    linked_at REAL NOT NULL,
+                    PRIMARY KEY (entity, article_id)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS entity_timeline (
+                    entity TEXT PRIMARY KEY,
+                    covered_since REAL NOT NULL,
+                    high_water REAL,
+                    refreshed_at REAL NOT NULL
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at);
+                CREATE INDEX IF NOT EXISTS idx_entity_articles_published ON entity_articles(entity, published_at);
+                CREATE INDEX IF NOT EXISTS idx_entity_articles_article ON entity_articles(article_id);
+                """
+            )
+
+    def put_articles(self, entity_name: str, articles: Iterable[Dict], covered_since: float = None, refreshed_at: float = None,
+                     reset_coverage: bool = False) -> int:
+        """
+        Upsert articles and link them to the entity in one transaction. With covered_since (epoch
+        seconds) the entity's timeline is extended to that point and its high-water mark and
+        refresh time are updated; reset_coverage replaces covered_since instead, for results that
+        may not join up with what is stored. Returns the number of articles written.
+        """
+        entity = normalize_entity(entity_name)
+        now = time.time()
+        rows = {}
+        for article in articles:
+            url = canonical_url(article.get("url", ""))
+            if url:
+                rows[url] = (url, publish_timestamp(article.get("publish_date", "")), json.dumps(article, ensure_ascii=False), now, now)
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    """INSERT INTO articles (url, published_at, payload, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT(url) DO UPDATE SET payload = excluded.payload, last_seen = excluded.last_seen,
+                       published_at = COALESCE(excluded.published_at, articles.published_at)""",
+                    rows.values()
+                )
+                self._conn.executemany(
+                    """INSERT OR IGNORE INTO entity_articles (entity, article_id, published_at, linked_at)
+                       SELECT ?, id, published_at, ? FROM articles WHERE url = ?""",
+                    [(entity, now, url) for url in rows]
+                )
+                if covered_since is not None:
+                    self._conn.execute(
+                        """INSERT INTO entity_timeline (entity, covered_since, high_water, refreshed_at)
+                           VALUES (?, ?, (SELECT MAX(published_at) FROM entity_articles WHERE entity = ?), ?)
+                           ON CONFLICT(entity) DO UPDATE SET
+                           covered_since = CASE WHEN ? THEN excluded.covered_since
+                                           ELSE MIN(entity_timeline.covered_since, excluded.covered_since) END,
+                           high_water = excluded.high_water,
+                           refreshed_at = MAX(entity_timeline.refreshed_at, excluded.refreshed_at)""",
+                        (entity, covered_since, entity, refreshed_at or now, reset_coverage)
+                    )
+        return len(rows)
+
+    def timeline(self, entity_name: str) -> Optional[Dict]:
+        """{"covered_since", "high_water", "refreshed_at"} in epoch seconds, None for an unknown entity."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_since, high_water, refreshed_at FROM entity_timeline WHERE entity = ?",
+                (normalize_entity(entity_name),)
+            ).fetchone()
+        return dict(zip(("covered_since", "high_water", "refreshed_at"), row)) if row else None
+
+    def count_articles(self, entity_name: str, days_back: int = None) -> int:
+        """Number of articles get_articles(entity_name, days_back) would return without a limit."""
+        query = "SELECT COUNT(*) FROM entity_articles WHERE entity = ?"
+        params = [normalize_entity(entity_name)]
+        if days_back is not None:
+            query += " AND (published_at >= ? OR published_at IS NULL)"
+            params.append((datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp())
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def get_articles(self, entity_name: str, days_back: int = None, limit: int = None) -> List[Dict]:
+        """Articles linked to the entity, newest first; days_back keeps only that publish window."""
+        query = ("SELECT a.payload FROM entity_articles e JOIN articles a ON a.id = e.article_id "
+                 "WHERE e.entity = ?")
+        params = [normalize_entity(entity_name)]
+        if days_back is not None:
+            # Undated articles are kept: they cannot be placed outside the window
+            query += " AND (e.published_at >= ? OR e.published_at IS NULL)"
+            params.append((datetime.now(timezone.utc) - timedelta(days=days_back)).timestamp())
+        query += " ORDER BY e.published_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def import_json_cache(self, cache_dir: str = "data/cache", entities: Iterable[str] = (), guess_names: bool = False) -> Dict:
+        """
+        One-time import of legacy NewsFetcher cache files (md5(entity_days_date).json / .cache).
+        The entity/days_back of a file is recovered by re-hashing candidate names around the file
+        date; candidates are entities, plus names inferred from the headlines with guess_names.
+        A guess is only used when its hash matches, and files that match no candidate are skipped
+        rather than filed under an invented entity.
+        """
+        summary = {"files": 0, "articles": 0, "matched_keys": 0, "unresolved": 0, "errors": 0}
+        if not os.path.isdir(cache_dir):
+            return summary
+        for name in sorted(os.listdir(cache_dir)):
+            cache_key, ext = os.path.splitext(name)
+            if ext not in (".json", ".cache"):
+                continue
+            path = os.path.join(cache_dir, name)
+            try:
+                articles = cache_codec.read_file(path)
+            except (OSError, ValueError):
+                summary["errors"] += 1
+                continue
+            if not isinstance(articles, list) or not articles:
+                continue
+            mtime = os.path.getmtime(path)
+            candidates = [*entities, infer_entity(articles)] if guess_names else list(entities)
+            resolved = self._resolve_legacy_key(cache_key, mtime, candidates)
+            if not resolved:
+                summary["unresolved"] += 1
+                continue
+            entity, days_back = resolved
+            summary["matched_keys"] += 1
+            covered_since = feed_coverage_start(articles, mtime - days_back * 86400)
+            summary["articles"] += self.put_articles(entity, articles, covered_since=covered_since, refreshed_at=mtime)
+            summary["files"] += 1
+        return summary
+
+    @staticmethod
+    def _resolve_legacy_key(cache_key: str, mtime: float, candidates: List[str]):
+        written = datetime.fromtimestamp(mtime).date()
+        for entity in dict.fromkeys(candidates):
+            for days_back in _LEGACY_DAYS_BACK:
+                for offset in (0, -1, 1):
+                    day = (written + timedelta(days=offset)).strftime("%Y-%m-%d")
+                    if hashlib.md5(f"{entity}_{days_back}_{day}".encode()).hexdigest() == cache_key:
+                        return entity, days_back
+        return None
+
+    def stats(self) -> Dict:
+        with self._lock:
+            articles = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            links = self._conn.execute("SELECT COUNT(*) FROM entity_articles").fetchone()[0]
+            entities = self._conn.execute("SELECT COUNT(DISTINCT entity) FROM entity_articles").fetchone()[0]
+            timelines = self._conn.execute("SELECT COUNT(*) FROM entity_timeline").fetchone()[0]
+        return {
+            "articles": articles,
+            "links": links,
+            "entities": entities,
+            "timelines": timelines,
+            "size_bytes": sum(os.path.getsize(p) for p in (self.path, f"{self.path}-wal") if os.path.exists(p))
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Import legacy data/cache files into the article store")
+    parser.add_argument("cache_dir", nargs="?", default="data/cache")
+    parser.add_argument("--db", default=os.getenv("ARTICLE_STORE_PATH", "data/articles.db"))
+    parser.add_argument("--entity", action="append", default=[], help="known entity names to match cache keys against")
+    parser.add_argument("--guess-names", action="store_true", help="also try names inferred from the headlines as key candidates")
+    args = parser.parse_args()
+    store = ArticleStore(args.db)
+    print(json.dumps({"import": store.import_json_cache(args.cache_dir, args.entity, args.guess_names), "store": store.stats()}, indent=2))
@@ -0,0 +1,75 @@
+"""
+On-disk format for NewsFetcher cache files
+- Compact JSON (orjson, no indentation) inside zstd framing; without zstandard the compact JSON
+  is stored uncompressed (gzip halves the size again but loads slower than the legacy format)
+- 5-byte header: magic b"RRC", format version, codec id
+- Files without the header are legacy pretty-printed JSON and are read as such
+"""
+import gzip
+import zlib
+from typing import Any
+
+import orjson
+
+try:
+    import zstandard
+except ImportError:  # uncompressed compact JSON is written instead
+    zstandard = None
+
+MAGIC = b"RRC"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 2
+CODEC_NONE, CODEC_GZIP, CODEC_ZSTD = 0, 1, 2
+CODEC_NAMES = {"none": CODEC_NONE, "gzip": CODEC_GZIP, "zstd": CODEC_ZSTD}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+_DECOMPRESS_ERRORS = (OSError, EOFError, zlib.error) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+
+def default_codec() -> str:
+    # gzip only on request: its decompression costs more than orjson saves over stdlib json
+    return "zstd" if zstandard is not None else "none"
+
+
+def dumps(data: Any, codec: str = None) -> bytes:
+    """Header + compact JSON, compressed with codec ("zstd", "gzip" or "none"; default_codec() if None)."""
+    codec_id = CODEC_NAMES[codec or default_codec()]
+    payload = orjson.dumps(data)
+    if codec_id == CODEC_GZIP:
+        # mtime=0 keeps the output deterministic for identical data
+        payload = gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0)
+    elif codec_id == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd codec requested but the zstandard package is not installed")
+        payload = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+    return MAGIC + bytes((FORMAT_VERSION, codec_id)) + payload
+
+
+def loads(raw: bytes) -> Any:
+    """Decode either format; raises ValueError for unknown versions/codecs or corrupt data."""
+    if not raw.startswith(MAGIC):
+        # Legacy json.dump(indent=2) file
+        return orjson.loads(raw)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("truncated cache header")
+    version, codec_id = raw[len(MAGIC)], raw[len(MAGIC) + 1]
+    if version > FORMAT_VERSION:
+        raise ValueError(f"cache format version {version} is newer than supported ({FORMAT_VERSION})")
+    payload = raw[HEADER_SIZE:]
+    if codec_id == CODEC_ZSTD and zstandard is None:
+        raise ValueError("cache file is zstd-compressed but the zstandard package is not installed")
+    if codec_id not in CODEC_NAMES.values():
+        raise ValueError(f"unknown cache codec id {codec_id}")
+    try:
+        if codec_id == CODEC_GZIP:
+            payload = gzip.decompress(payload)
+        elif codec_id == CODEC_ZSTD:
+            payload = zstandard.ZstdDecompressor().decompress(payload)
+    except _DECOMPRESS_ERRORS as e:
+        raise ValueError(f"corrupt cache payload: {e}") from e
+    return orjson.loads(payload)
+
+
+def read_file(path: str) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
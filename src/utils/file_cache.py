@@ -0,0 +1,247 @@
+"""
+Bounded on-disk cache for NewsFetcher results
+- Entries live in 256 shard directories (<root>/<first two hex chars of key>/<key>.cache)
+- Per-entry TTL: a file's mtime is set to its expiry time; atime records the last hit for LRU
+- Byte and entry budgets; a janitor thread removes expired entries, then least recently
+  used ones until the cache fits, and reports evictions and disk usage
+- Flat <root>/<key>.json / .cache files from older versions are still read; they are only
+  swept when asked (sweep(include_legacy=True) or the CLI), since data/cache also holds the
+  recorded benchmark corpus
+
+One-off sweep, run with src on the path:
+    PYTHONPATH=src python -m utils.file_cache data/cache --include-legacy
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from utils import cache_codec
+
+CACHE_EXT = ".cache"
+LEGACY_EXTS = (".json", CACHE_EXT)
+# Leftover temp files from interrupted writes older than this are removed by the janitor
+TMP_MAX_AGE_SECONDS = 3600
+
+
+class FileCache:
+    """
+    ttl_seconds is the default lifetime of an entry; put() can override it per entry.
+    janitor_interval=None disables the background thread (call sweep() yourself).
+    """
+
+    def __init__(self, root: str = "data/cache", max_bytes: int = None, max_entries: int = None,
+                 ttl_seconds: float = None, janitor_interval: Optional[float] = 300.0):
+        self.root = root
+        self.max_bytes = max_bytes or int(float(os.getenv("NEWS_CACHE_MAX_MB", "256")) * 2 ** 20)
+        self.max_entries = max_entries or int(os.getenv("NEWS_CACHE_MAX_ENTRIES", "10000"))
+        self.ttl_seconds = ttl_seconds or float(os.getenv("NEWS_CACHE_TTL_HOURS", "24")) * 3600
+        os.makedirs(root, exist_ok=True)
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "writes": 0, "expired": 0, "evicted": 0, "freed_bytes": 0, "sweeps": 0}
+        # Usage as of the last sweep plus writes since; an over-budget write wakes the janitor early
+        self._usage = {"entries": 0, "bytes": 0}
+        self.last_sweep: Optional[Dict] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._janitor = None
+        if janitor_interval:
+            self._janitor = threading.Thread(target=self._run_janitor, args=(janitor_interval,), name="news-cache-janitor", daemon=True)
+            self._janitor.start()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}{CACHE_EXT}")
+
+    def get(self, key: str) -> Any:
+        """Cached value, or None when missing or expired."""
+        now = time.time()
+        path = self.path_for(key)
+        try:
+            st = os.stat(path)
+            if st.st_mtime <= now:
+                self._remove(path, st.st_size, "expired")
+                raise FileNotFoundError(path)
+            data = cache_codec.read_file(path)
+            # Record the hit for LRU; mtime keeps the expiry time
+            os.utime(path, (now, st.st_mtime))
+        except FileNotFoundError:
+            data = self._get_legacy(key, now)
+        except ValueError as e:
+            print(f"⚠️  Dropping unreadable cache entry {key}: {e}")
+            self._remove(path, 0, "evicted")
+            data = None
+        self._count("hits" if data is not None else "misses")
+        return data
+
+    def _get_legacy(self, key: str, now: float) -> Any:
+        for ext in LEGACY_EXTS:
+            path = os.path.join(self.root, f"{key}{ext}")
+            try:
+                if os.path.getmtime(path) + self.ttl_seconds > now:
+                    return cache_codec.read_file(path)
+            except FileNotFoundError:
+                continue
+        return None
+
+    def put(self, key: str, value: Any, ttl_seconds: float = None):
+        """Write atomically (temp file + rename) with expiry now + ttl_seconds."""
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        raw = cache_codec.dumps(value)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        now = time.time()
+        os.utime(tmp_path, (now, now + (ttl_seconds or self.ttl_seconds)))
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._counters["writes"] += 1
+            self._usage["entries"] += 1
+            self._usage["bytes"] += len(raw)
+            over_budget = self._usage["entries"] > self.max_entries or self._usage["bytes"] > self.max_bytes
+        if over_budget:
+            self._wake.set()
+
+    def sweep(self, include_legacy: bool = False) -> Dict:
+        """Remove expired entries, then least recently used ones until both budgets are met."""
+        started = time.perf_counter()
+        now = time.time()
+        expired = evicted = freed = 0
+        live = []
+        for path, st, legacy in self._scan(include_legacy):
+            if path.endswith(".tmp"):
+                if now - st.st_ctime > TMP_MAX_AGE_SECONDS and self._unlink(path):
+                    freed += st.st_size
+                continue
+            expires_at = st.st_mtime + self.ttl_seconds if legacy else st.st_mtime
+            if expires_at <= now:
+                if self._unlink(path):
+                    expired += 1
+                    freed += st.st_size
+                continue
+            live.append((st.st_atime, st.st_size, path))
+        entries, total_bytes = len(live), sum(size for _, size, _ in live)
+        if entries > self.max_entries or total_bytes > self.max_bytes:
+            live.sort()
+            for _, size, path in live:
+                if entries <= self.max_entries and total_bytes <= self.max_bytes:
+                    break
+                if self._unlink(path):
+                    entries -= 1
+                    total_bytes -= size
+                    evicted += 1
+                    freed += size
+        report = {
+            "timestamp": now,
+            "entries": entries,
+            "bytes": total_bytes,
+            "expired": expired,
+            "evicted": evicted,
+            "freed_bytes": freed,
+            "seconds": round(time.perf_counter() - started, 3)
+        }
+        with self._lock:
+            self._usage = {"entries": entries, "bytes": total_bytes}
+            self._counters["sweeps"] += 1
+            self._counters["expired"] += expired
+            self._counters["evicted"] += evicted
+            self._counters["freed_bytes"] += freed
+            self.last_sweep = report
+        if expired or evicted:
+            print(f"🧹 News cache janitor: {expired} expired, {evicted} evicted, {freed / 2 ** 20:.1f} MB freed; "
+                  f"{entries} entries / {total_bytes / 2 ** 20:.1f} MB in use")
+        return report
+
+    def _scan(self, include_legacy: bool) -> Iterator[Tuple[str, os.stat_result, bool]]:
+        with os.scandir(self.root) as top:
+            for item in top:
+                if item.is_dir(follow_symlinks=False) and len(item.name) == 2:
+                    with os.scandir(item.path) as shard:
+                        for entry in shard:
+                            if entry.is_file(follow_symlinks=False):
+                                st = self._stat(entry)
+                                if st is not None:
+                                    yield entry.path, st, False
+                elif include_legacy and item.is_file(follow_symlinks=False) and item.name.endswith(LEGACY_EXTS):
+                    st = self._stat(item)
+                    if st is not None:
+                        yield item.path, st, True
+
+    @staticmethod
+    def _stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+        try:
+            return entry.stat(follow_symlinks=False)
+        except FileNotFoundError:
+            # Removed by a concurrent get() or another process
+            return None
+
+    def _remove(self, path: str, size: int, reason: str):
+        if self._unlink(path):
+            with self._lock:
+                self._counters[reason] += 1
+                self._counters["freed_bytes"] += size
+                self._usage["entries"] = max(self._usage["entries"] - 1, 0)
+                self._usage["bytes"] = max(self._usage["bytes"] - size, 0)
+
+    @staticmethod
+    def _unlink(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _count(self, name: str):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _run_janitor(self, interval: float):
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except OSError as e:
+                print(f"⚠️  News cache janitor error: {e}")
+            self._wake.wait(interval)
+            self._wake.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                **self._counters,
+                **self._usage,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "last_sweep": self.last_sweep
+            }
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        if self._janitor is not None:
+            self._janitor.join()
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_news_cache() -> FileCache:
+    """Process-wide FileCache for data/cache so there is one janitor per process."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = FileCache(janitor_interval=float(os.getenv("NEWS_CACHE_JANITOR_SECONDS", "300")))
+        return _default_cache
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Sweep the news cache once and print the report")
+    parser.add_argument("root", nargs="?", default="data/cache")
+    parser.add_argument("--include-legacy", action="store_true", help="also expire/evict flat pre-sharding files")
+    args = parser.parse_args()
+    cache = FileCache(args.root, janitor_interval=None)
+    print(json.dumps({**cache.sweep(include_legacy=args.include_legacy), "stats": cache.stats()}, indent=2))
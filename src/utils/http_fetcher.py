@@ -0,0 +1,101 @@
+"""
+Pooled HTTP fetch layer for RSS feeds
+- One requests.Session per process with a keep-alive connection pool and connect/read timeouts
+- Retries idempotent GETs on connection errors and 502/503/504 with backoff
+- Remembers ETag / Last-Modified per URL and sends conditional requests; a 304 reuses the
+  feed parsed last time instead of downloading and parsing it again
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+
+import feedparser
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (compatible; SentinelAI/1.0)"
+
+
+class FeedFetcher:
+    def __init__(self, connect_timeout: float = None, read_timeout: float = None, pool_maxsize: int = None,
+                 max_retries: int = 2, max_entries: int = 256):
+        self.connect_timeout = connect_timeout or float(os.getenv("RSS_CONNECT_TIMEOUT", "5"))
+        self.read_timeout = read_timeout or float(os.getenv("RSS_READ_TIMEOUT", "10"))
+        self.max_entries = max_entries
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, deflate"})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize or int(os.getenv("RSS_POOL_SIZE", "10")),
+            max_retries=Retry(total=max_retries, connect=max_retries, read=max_retries, backoff_factor=0.5,
+                              status_forcelist=(502, 503, 504), allowed_methods=frozenset({"GET"}))
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # url -> (etag, last_modified, parsed feed), least recently used first
+        self._validators: "OrderedDict[str, Tuple[str, str, feedparser.FeedParserDict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "not_modified": 0, "downloaded": 0, "bytes": 0, "parse_seconds": 0.0}
+
+    def fetch_feed(self, url: str, read_timeout: float = None) -> Tuple[feedparser.FeedParserDict, bool]:
+        """
+        Return (parsed feed, not_modified).
+        Raises requests.RequestException on network errors and non-2xx/304 responses.
+        """
+        with self._lock:
+            known = self._validators.get(url)
+        headers = {}
+        if known is not None:
+            etag, last_modified, _ = known
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        response = self.session.get(url, headers=headers, timeout=(self.connect_timeout, read_timeout or self.read_timeout))
+        self._count("requests")
+        if response.status_code == 304 and known is not None:
+            self._count("not_modified")
+            with self._lock:
+                self._validators.move_to_end(url)
+            return known[2], True
+        response.raise_for_status()
+        self._count("downloaded")
+        self._count("bytes", len(response.content))
+        started = time.perf_counter()
+        feed = feedparser.parse(response.content, response_headers={k.lower(): v for k, v in response.headers.items()})
+        self._count("parse_seconds", time.perf_counter() - started)
+        etag, last_modified = response.headers.get("ETag"), response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._lock:
+                self._validators[url] = (etag, last_modified, feed)
+                self._validators.move_to_end(url)
+                while len(self._validators) > self.max_entries:
+                    self._validators.popitem(last=False)
+        return feed, False
+
+    def _count(self, name: str, amount: float = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {**self._counters, "parse_seconds": round(self._counters["parse_seconds"], 3), "validators": len(self._validators)}
+
+    def close(self):
+        self.session.close()
+
+
+_default_fetcher = None
+_default_lock = threading.Lock()
+
+
+def get_feed_fetcher() -> FeedFetcher:
+    """Process-wide FeedFetcher so every NewsFetcher shares the pool and the validators."""
+    global _default_fetcher
+    with _default_lock:
+        if _default_fetcher is None:
+            _default_fetcher = FeedFetcher()
+        return _default_fetcher
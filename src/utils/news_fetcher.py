@@ -1,26 +1,47 @@
 """
 Enhanced News Fetcher with Balanced Coverage
 - Fetches ALL news (not just negative)
-- Caching support for faster results
+- Caching support for faster results (compact JSON, zstd-compressed when available; utils/cache_codec.py)
+- Bounded, sharded cache directory with TTL/LRU eviction by a background janitor (utils/file_cache.py)
 - Better error handling
 - Supports unlimited articles
+- Normalizes RSS HTML into clean text before screening
+- Pooled HTTP with timeouts and conditional GETs (utils/http_fetcher.py)
+- Optional SQLite article store instead of per-key JSON files (utils/article_store.py);
+  with a store each entity keeps a timeline that is refreshed incrementally
+
+Self-test, run with src on the path:
+    PYTHONPATH=src python -m utils.news_fetcher
 """
-import feedparser
-import requests
 from datetime import datetime, timedelta
 from typing import List, Dict
 from urllib.parse import quote
 import random
 import hashlib
-import json
 import os
+import time
+
+from utils.article_store import ArticleStore, feed_coverage_start, publish_timestamp
+from utils.file_cache import FileCache, get_news_cache
+from utils.http_fetcher import get_feed_fetcher
+from utils.text_normalizer import normalize_article, normalization_stats
 
 class NewsFetcher:
-    def __init__(self):
+    def __init__(self, store: ArticleStore = None, refresh_minutes: float = None, cache: FileCache = None):
         self.base_url = "https://news.google.com/rss/search"
         self.timeout = 10
-        self.cache_dir = "data/cache"
-        os.makedirs(self.cache_dir, exist_ok=True)
+        # Shared session/connection pool; remembers ETag/Last-Modified across NewsFetcher instances
+        self.http = get_feed_fetcher()
+        # When set, articles are read from / written to the store instead of the file cache
+        self.store = store
+        # Shared bounded file cache (one janitor per process) unless a private one is passed
+        self.cache = cache if cache is not None else (get_news_cache() if store is None else None)
+        # How old a stored timeline may get before the next request checks for newer articles
+        if refresh_minutes is None:
+            refresh_minutes = float(os.getenv("NEWS_REFRESH_MINUTES", "30"))
+        self.refresh_interval = refresh_minutes * 60
+        # Size/token savings of the last normalize_articles call
+        self.last_normalization_stats = None
     
     def _get_cache_key(self, entity_name: str, days_back: int) -> str:
         """Generate cache key for entity + date"""
@@ -28,31 +49,126 @@ class NewsFetcher:
         return hashlib.md5(key_string.encode()).hexdigest()
     
     def _load_from_cache(self, cache_key: str) -> List[Dict]:
-        """Load cached results if available"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-        if os.path.exists(cache_file):
-            try:
-                # Check if cache is from today
-                cache_time = os.path.getmtime(cache_file)
-                cache_date = datetime.fromtimestamp(cache_time).date()
-                if cache_date == datetime.now().date():
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        print(f"💾 Loaded {len(data)} articles from cache")
-                        return data
-            except Exception as e:
-                print(f"⚠️  Cache read error: {e}")
+        """Load cached results if available and not expired"""
+        try:
+            data = self.cache.get(cache_key)
+            if data is not None:
+                print(f"💾 Loaded {len(data)} articles from cache")
+                return data
+        except Exception as e:
+            print(f"⚠️  Cache read error: {e}")
         return None
     
     def _save_to_cache(self, cache_key: str, data: List[Dict]):
         """Save results to cache"""
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            self.cache.put(cache_key, data)
         except Exception as e:
             print(f"⚠️  Cache write error: {e}")
     
+    def _fetch_rss_articles(self, entity_name: str, after_date: str) -> List[Dict]:
+        """
+        Articles published after after_date (YYYY-MM-DD) from Google News RSS
+        Raises requests.RequestException on network errors
+        """
+        # BALANCED QUERY - just the entity name, no negative keyword bias
+        query = f'"{entity_name}"'
+        
+        # Build RSS URL
+        query_encoded = quote(query, safe='')
+        rss_url = f"{self.base_url}?q={query_encoded}+after:{after_date}&hl=en-US&gl=US&ceid=US:en"
+        
+        # Conditional GET; an unchanged feed comes back as 304 with the previously parsed entries
+        feed, not_modified = self.http.fetch_feed(rss_url, read_timeout=self.timeout)
+        if not_modified:
+            print("♻️  Feed unchanged since last fetch (304)")
+        
+        articles = []
+        for entry in feed.entries:
+            title = entry.get('title', '')
+            summary = entry.get('summary', '')
+            link = entry.get('link', '')
+            
+            # Extract source
+            source = 'Unknown'
+            if hasattr(entry, 'source') and hasattr(entry.source, 'title'):
+                source = entry.source.title
+            
+            pub_date = entry.get('published', '')
+            
+            # Skip very short articles (likely duplicates or stubs)
+            if len(summary) < 50:
+                continue
+            
+            articles.append({
+                "title": title,
+                "content": summary,
+                "url": link,
+                "source": source,
+                "publish_date": pub_date
+            })
+        return articles
+    
+    def _fetch_timeline(self, entity_name: str, days_back: int, max_results: int) -> List[Dict]:
+        """
+        Serve the days_back window from the entity's stored timeline
+        - Window not covered yet (new entity or longer days_back): fetch the whole window
+        - Covered but last refreshed over refresh_interval ago: fetch only articles newer
+          than the high-water mark
+        - Otherwise no network request; shorter windows are slices of what is stored
+        - A feed that hits its item cap only covers back to its oldest article, so that is
+          what the timeline records (see feed_coverage_start); the window still counts as served
+          once the store holds max_results articles inside it, which is all a request returns
+        """
+        now = time.time()
+        window_start = now - days_back * 86400
+        try:
+            timeline = self.store.timeline(entity_name)
+            served = timeline is not None and (
+                timeline["covered_since"] <= window_start
+                or self.store.count_articles(entity_name, days_back) >= max_results
+            )
+            if not served:
+                print(f"🔍 Fetching balanced news coverage for '{entity_name}'...")
+                after_date = datetime.fromtimestamp(window_start).strftime("%Y-%m-%d")
+                articles = self._fetch_rss_articles(entity_name, after_date)
+                covered_since = feed_coverage_start(articles, window_start)
+                # A truncated feed is contiguous only back to its oldest article
+                self.store.put_articles(entity_name, articles, covered_since=covered_since, refreshed_at=now,
+                                        reset_coverage=covered_since > window_start)
+                print(f"✅ Found {len(articles)} articles from Google News RSS")
+            elif now - timeline["refreshed_at"] >= self.refresh_interval:
+                high_water = timeline["high_water"] or timeline["covered_since"]
+                # after: is day-granular; start a day early and filter on the exact publish time
+                after_date = datetime.fromtimestamp(high_water - 86400).strftime("%Y-%m-%d")
+                print(f"🔄 Refreshing '{entity_name}' since {datetime.fromtimestamp(high_water):%Y-%m-%d %H:%M}...")
+                fetched = self._fetch_rss_articles(entity_name, after_date)
+                articles = [
+                    article for article in fetched
+                    if (publish_timestamp(article["publish_date"]) or now) > high_water
+                ]
+                # A truncated refresh may not reach back to the high-water mark, leaving a gap
+                covered_since = feed_coverage_start(fetched, high_water - 86400)
+                truncated = covered_since > high_water
+                self.store.put_articles(entity_name, articles, covered_since=covered_since if truncated else now,
+                                        refreshed_at=now, reset_coverage=truncated)
+                print(f"✅ {len(articles)} new articles since last refresh")
+            else:
+                print(f"💾 Timeline refreshed {int((now - timeline['refreshed_at']) // 60)} min ago, no fetch needed")
+        except Exception as e:
+            print(f"⚠️  Error fetching Google RSS: {e}")
+        
+        try:
+            articles = self.store.get_articles(entity_name, days_back, limit=max_results)
+        except Exception as e:
+            print(f"⚠️  Article store read error: {e}")
+            articles = []
+        if articles:
+            print(f"💾 Loaded {len(articles)} articles from article store")
+            return articles
+        print("⚠️  No valid articles found, using demo data")
+        return self._get_demo_data(entity_name)
+    
     def fetch_google_news_rss(self, entity_name: str, days_back: int = 30, max_results: int = 100) -> List[Dict]:
         """
         Fetch BALANCED news coverage from Google News RSS
@@ -60,6 +176,8 @@ class NewsFetcher:
         - No keyword bias toward negative news
         - Supports caching for faster results
         """
+        if self.store is not None:
+            return self._fetch_timeline(entity_name, days_back, max_results)
         
         # Check cache first
         cache_key = self._get_cache_key(entity_name, days_back)
@@ -68,49 +186,11 @@ class NewsFetcher:
             return cached_data[:max_results]
         
         try:
-            # BALANCED QUERY - just the entity name, no negative keyword bias
-            query = f'"{entity_name}"'
-            
             # Calculate date range
             after_date = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
             
-            # Build RSS URL
-            query_encoded = quote(query, safe='')
-            rss_url = f"{self.base_url}?q={query_encoded}+after:{after_date}&hl=en-US&gl=US&ceid=US:en"
-            
             print(f"🔍 Fetching balanced news coverage for '{entity_name}'...")
-            
-            # Parse RSS feed
-            feed = feedparser.parse(rss_url)
-            
-            if not feed.entries:
-                print("⚠️  No articles found in Google RSS, using demo data")
-                return self._get_demo_data(entity_name)
-            
-            articles = []
-            for entry in feed.entries:
-                title = entry.get('title', '')
-                summary = entry.get('summary', '')
-                link = entry.get('link', '')
-                
-                # Extract source
-                source = 'Unknown'
-                if hasattr(entry, 'source') and hasattr(entry.source, 'title'):
-                    source = entry.source.title
-                
-                pub_date = entry.get('published', '')
-                
-                # Skip very short articles (likely duplicates or stubs)
-                if len(summary) < 50:
-                    continue
-                
-                articles.append({
-                    "title": title,
-                    "content": summary,
-                    "url": link,
-                    "source": source,
-                    "publish_date": pub_date
-                })
+            articles = self._fetch_rss_articles(entity_name, after_date)
             
             if articles:
                 print(f"✅ Found {len(articles)} articles from Google News RSS")
@@ -214,6 +294,18 @@ class NewsFetcher:
         print(f"📝 Generated {len(articles)} balanced demo articles (positive + negative + neutral)")
         return articles
     
+    def normalize_articles(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Replace RSS HTML with clean text for screening
+        - Raw HTML/title are kept as raw_content / raw_title
+        - Records the estimated token savings in last_normalization_stats
+        """
+        normalized = [normalize_article(article) for article in articles]
+        self.last_normalization_stats = normalization_stats(normalized)
+        stats = self.last_normalization_stats
+        print(f"🧹 Normalized {stats['articles']} articles: ~{stats['raw_tokens_est']} → ~{stats['clean_tokens_est']} tokens ({stats['saved_pct']}% saved)")
+        return normalized
+    
     def fetch_all_news(self, entity_name: str, days_back: int = 30, max_articles: int = 100) -> List[Dict]:
         """
         Main method to fetch news
@@ -225,6 +317,8 @@ class NewsFetcher:
         # Fetch from Google News RSS
         articles = self.fetch_google_news_rss(entity_name, days_back, max_articles)
         
+        articles = self.normalize_articles(articles)
+        
         # Remove duplicates by URL
         seen_urls = set()
         unique_articles = []
@@ -0,0 +1,95 @@
+"""
+Article text normalization for LLM screening
+- Extracts plain text from Google News RSS summary HTML
+- Drops redirect links, &nbsp; padding and <font> publisher tags
+- Strips the trailing " - Publisher" suffix from titles
+"""
+import re
+from html import unescape
+from html.parser import HTMLParser
+from typing import Dict, List
+
+from models.prompts import CHARS_PER_TOKEN
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class _TextExtractor(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("li", "p", "br", "div"):
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def html_to_text(html: str) -> str:
+    """Visible text of an HTML fragment with whitespace collapsed."""
+    if "<" not in html and "&" not in html:
+        return _WHITESPACE_RE.sub(" ", html).strip()
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    extractor.close()
+    text = unescape("".join(extractor.parts)).replace("\xa0", " ")
+    lines = (_WHITESPACE_RE.sub(" ", line).strip() for line in text.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def strip_publisher_suffix(title: str, source: str = "") -> str:
+    """'Headline - Reuters' -> 'Headline' (only when the suffix is the publisher)."""
+    title = title.strip()
+    if source and title.endswith(f" - {source}"):
+        return title[:-len(source) - 3].rstrip()
+    if source and source != "Unknown":
+        # A known publisher that does not match: the tail is part of the headline
+        return title
+    head, sep, tail = title.rpartition(" - ")
+    # Without a known source, only drop short trailing segments that look like a masthead
+    if sep and head and len(tail) <= 40 and len(tail.split()) <= 6:
+        return head.rstrip()
+    return title
+
+
+def normalize_article(article: Dict) -> Dict:
+    """
+    Return a copy with clean title/content.
+    The original strings are kept under raw_title / raw_content.
+    """
+    if "raw_content" in article:
+        return article
+    source = article.get("source", "")
+    raw_title = article.get("title", "")
+    raw_content = article.get("content", "")
+    title = strip_publisher_suffix(html_to_text(raw_title), source)
+    content = html_to_text(raw_content)
+    if source and content.endswith(source):
+        content = content[:-len(source)].rstrip()
+    # RSS summaries usually just repeat the headline; do not send it to the model twice
+    if content.lower() == title.lower():
+        content = ""
+    return {
+        **article,
+        "title": title,
+        "content": content,
+        "raw_title": raw_title,
+        "raw_content": raw_content
+    }
+
+
+def normalization_stats(articles: List[Dict]) -> Dict:
+    """Character and estimated token savings of normalized articles vs. their raw form."""
+    raw_chars = sum(len(a.get("raw_title", a.get("title", ""))) + len(a.get("raw_content", a.get("content", ""))) for a in articles)
+    clean_chars = sum(len(a.get("title", "")) + len(a.get("content", "")) for a in articles)
+    return {
+        "articles": len(articles),
+        "raw_chars": raw_chars,
+        "clean_chars": clean_chars,
+        "raw_tokens_est": raw_chars // CHARS_PER_TOKEN,
+        "clean_tokens_est": clean_chars // CHARS_PER_TOKEN,
+        "tokens_saved_est": (raw_chars - clean_chars) // CHARS_PER_TOKEN,
+        "saved_pct": round(100 * (raw_chars - clean_chars) / raw_chars, 1) if raw_chars else 0.0
+    }